@@ -0,0 +1,61 @@
+"""Notify cache listeners on catalog table changes
+
+Revision ID: 3b1f0c7d9a21
+Revises: 92e72b944d58
+Create Date: 2025-10-15 12:00:00.000000
+
+PostgreSQL only: statement-level triggers on the catalog tables call
+pg_notify('metahub_cache', <table name>) so every app process can drop
+its cached list responses as soon as a write commits.
+SQLite has no LISTEN/NOTIFY and is left unchanged.
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3b1f0c7d9a21'
+down_revision: str | Sequence[str] | None = '92e72b944d58'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+CATALOG_TABLES = (
+    'tx_taxonomy',
+    'tx_term',
+    'cm_codeset',
+    'cm_code',
+    'custom_meta_group',
+    'custom_meta_item',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION metahub_notify_cache() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('metahub_cache', TG_TABLE_NAME);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in CATALOG_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_notify_cache
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION metahub_notify_cache()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in CATALOG_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_notify_cache ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS metahub_notify_cache()")
@@ -0,0 +1,32 @@
+"""Index code_key and term_key for lookups without their parent
+
+Revision ID: 5d7e2a4c8b13
+Revises: 3b1f0c7d9a21
+Create Date: 2025-10-16 09:00:00.000000
+
+Meta value writes resolve codes and terms by key alone; the existing
+unique constraints lead with codeset_id / taxonomy_id and can't serve
+those lookups.
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5d7e2a4c8b13'
+down_revision: str | Sequence[str] | None = '3b1f0c7d9a21'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_code_key', 'cm_code', ['code_key'], unique=False)
+    op.create_index('ix_term_key', 'tx_term', ['term_key'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_term_key', table_name='tx_term')
+    op.drop_index('ix_code_key', table_name='cm_code')
@@ -0,0 +1,46 @@
+"""Notify cache listeners on meta value changes
+
+Revision ID: 8a4c6e1f2b57
+Revises: 5d7e2a4c8b13
+Create Date: 2025-10-16 10:00:00.000000
+
+PostgreSQL only: adds the metahub_notify_cache() trigger to the meta value
+tables, whose list responses are now cached per process as well.
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4c6e1f2b57'
+down_revision: str | Sequence[str] | None = '5d7e2a4c8b13'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+META_VALUE_TABLES = (
+    'custom_meta_value',
+    'custom_meta_value_version',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in META_VALUE_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_notify_cache
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION metahub_notify_cache()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in META_VALUE_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_notify_cache ON {table}")
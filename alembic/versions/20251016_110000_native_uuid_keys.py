@@ -0,0 +1,76 @@
+"""Store UUID keys as native uuid
+
+Revision ID: c3e9b7a1d604
+Revises: 8a4c6e1f2b57
+Create Date: 2025-10-16 11:00:00.000000
+
+PostgreSQL only: converts every varchar(36) id column to uuid, which halves
+the key and index size and compares keys as 16 bytes. The foreign keys are
+dropped around the conversion because both ends must change type together.
+SQLite has no uuid type and keeps the text columns.
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e9b7a1d604'
+down_revision: str | Sequence[str] | None = '8a4c6e1f2b57'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+UUID_COLUMNS = {
+    'cm_codeset': ('codeset_id',),
+    'cm_code': ('code_id', 'codeset_id', 'current_version_id'),
+    'cm_code_version': ('code_version_id', 'code_id', 'parent_code_id'),
+    'custom_meta_group': ('group_id',),
+    'custom_meta_item': ('item_id', 'group_id'),
+    'custom_meta_value': ('value_id', 'item_id', 'current_version_id'),
+    'custom_meta_value_version': ('version_id', 'value_id'),
+    'tx_taxonomy': ('taxonomy_id',),
+    'tx_term': ('term_id', 'taxonomy_id', 'parent_term_id', 'current_version_id'),
+    'tx_term_version': ('version_id', 'term_id'),
+}
+
+# (table, column, referenced table, referenced column), named as PostgreSQL
+# named the unnamed constraints of the initial schema
+FOREIGN_KEYS = (
+    ('cm_code', 'codeset_id', 'cm_codeset', 'codeset_id'),
+    ('cm_code_version', 'code_id', 'cm_code', 'code_id'),
+    ('cm_code_version', 'parent_code_id', 'cm_code', 'code_id'),
+    ('custom_meta_item', 'group_id', 'custom_meta_group', 'group_id'),
+    ('custom_meta_value', 'item_id', 'custom_meta_item', 'item_id'),
+    ('custom_meta_value_version', 'value_id', 'custom_meta_value', 'value_id'),
+    ('tx_term', 'taxonomy_id', 'tx_taxonomy', 'taxonomy_id'),
+    ('tx_term', 'parent_term_id', 'tx_term', 'term_id'),
+    ('tx_term_version', 'term_id', 'tx_term', 'term_id'),
+)
+
+
+def _convert(type_: str, cast: str) -> None:
+    for table, column, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(f'{table}_{column}_fkey', table, type_='foreignkey')
+    for table, columns in UUID_COLUMNS.items():
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(f"ALTER COLUMN {column} TYPE {type_} USING {column}::{cast}" for column in columns)
+        )
+    for table, column, referred_table, referred_column in FOREIGN_KEYS:
+        op.create_foreign_key(f'{table}_{column}_fkey', table, referred_table, [column], [referred_column])
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    _convert('uuid', 'uuid')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    _convert('varchar(36)', 'text')
@@ -0,0 +1,43 @@
+"""Cover current_version_id in the value target unique index
+
+Revision ID: e1f4a8c2b970
+Revises: c3e9b7a1d604
+Create Date: 2025-10-16 12:00:00.000000
+
+ix_value_target (target_type, target_id) is a prefix of
+uq_value_target_item and is dropped. On PostgreSQL the unique constraint
+is rebuilt with INCLUDE (current_version_id), so looking up the current
+version of a (target, item) pair is an index-only scan.
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f4a8c2b970'
+down_revision: str | Sequence[str] | None = 'c3e9b7a1d604'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _rebuild_unique(include: str) -> None:
+    op.execute("ALTER TABLE custom_meta_value DROP CONSTRAINT uq_value_target_item")
+    op.execute(
+        "ALTER TABLE custom_meta_value ADD CONSTRAINT uq_value_target_item "
+        f"UNIQUE (target_type, target_id, item_id){include}"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_value_target', table_name='custom_meta_value')
+    if op.get_bind().dialect.name == 'postgresql':
+        _rebuild_unique(' INCLUDE (current_version_id)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        _rebuild_unique('')
+    op.create_index('ix_value_target', 'custom_meta_value', ['target_type', 'target_id'], unique=False)
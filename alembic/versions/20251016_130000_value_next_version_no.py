@@ -0,0 +1,41 @@
+"""Keep the next version number on custom_meta_value
+
+Revision ID: 4f7b2d9e6a38
+Revises: e1f4a8c2b970
+Create Date: 2025-10-16 13:00:00.000000
+
+Meta value writes read and bump next_version_no on the value row they
+already lock, instead of running SELECT MAX(version_no) over the versions.
+Existing rows are backfilled from their versions.
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '4f7b2d9e6a38'
+down_revision: str | Sequence[str] | None = 'e1f4a8c2b970'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('custom_meta_value') as batch_op:
+        batch_op.add_column(sa.Column('next_version_no', sa.Integer(), server_default='1', nullable=False))
+    op.execute("""
+        UPDATE custom_meta_value
+        SET next_version_no = COALESCE((
+            SELECT MAX(v.version_no) FROM custom_meta_value_version v
+            WHERE v.value_id = custom_meta_value.value_id
+        ), 0) + 1
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('custom_meta_value') as batch_op:
+        batch_op.drop_column('next_version_no')
@@ -0,0 +1,79 @@
+"""Notify the changed target on meta value writes
+
+Revision ID: 7d2b9f4e1c86
+Revises: 4f7b2d9e6a38
+Create Date: 2025-10-16 14:00:00.000000
+
+PostgreSQL only: meta value responses are cached per target, but the
+statement-level triggers on custom_meta_value and custom_meta_value_version
+only named the table, so every write dropped every target's cache.
+Every write inserts or updates its custom_meta_value row, so a row-level
+trigger on that table alone now sends '<target_type>:<target_id>' on the
+metahub_cache_values channel. TRUNCATE can't be row-level and keeps the
+table-name notification.
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2b9f4e1c86'
+down_revision: str | Sequence[str] | None = '4f7b2d9e6a38'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+META_VALUE_TABLES = (
+    'custom_meta_value',
+    'custom_meta_value_version',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in META_VALUE_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_notify_cache ON {table}")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION metahub_notify_meta_value_target() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                PERFORM pg_notify('metahub_cache_values', OLD.target_type || ':' || OLD.target_id);
+            END IF;
+            IF TG_OP <> 'DELETE' THEN
+                PERFORM pg_notify('metahub_cache_values', NEW.target_type || ':' || NEW.target_id);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER custom_meta_value_notify_target
+        AFTER INSERT OR UPDATE OR DELETE ON custom_meta_value
+        FOR EACH ROW EXECUTE FUNCTION metahub_notify_meta_value_target()
+    """)
+    op.execute("""
+        CREATE TRIGGER custom_meta_value_notify_cache
+        AFTER TRUNCATE ON custom_meta_value
+        FOR EACH STATEMENT EXECUTE FUNCTION metahub_notify_cache()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS custom_meta_value_notify_cache ON custom_meta_value")
+    op.execute("DROP TRIGGER IF EXISTS custom_meta_value_notify_target ON custom_meta_value")
+    op.execute("DROP FUNCTION IF EXISTS metahub_notify_meta_value_target()")
+
+    for table in META_VALUE_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_notify_cache
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION metahub_notify_cache()
+        """)
@@ -1,8 +1,9 @@
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1 import bootstrap, codeset, health, meta_types, meta_values, taxonomy
 
-api_router = APIRouter(prefix="/api/v1")
+api_router = APIRouter(prefix="/api/v1", default_response_class=ORJSONResponse)
 
 api_router.include_router(health.router)
 api_router.include_router(taxonomy.router)
@@ -1,18 +1,31 @@
 from fastapi import APIRouter, Depends
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import invalidate_on_commit
 from app.core.deps import get_session
 from app.core.meta_types import MetaTypeKind
+from app.models.codeset import CodeSet
+from app.models.meta_types import CustomMetaGroup, CustomMetaItem
+from app.models.taxonomy import Taxonomy
 from app.services.bootstrap_service import bootstrap_demo
 
 router = APIRouter(prefix="/bootstrap", tags=["bootstrap"])
 
+# Count existing data in a single round trip
+_STATUS_COUNTS = select(
+    select(func.count(Taxonomy.taxonomy_id)).scalar_subquery().label("taxonomies"),
+    select(func.count(CodeSet.codeset_id)).scalar_subquery().label("codesets"),
+    select(func.count(CustomMetaGroup.group_id)).scalar_subquery().label("meta_groups"),
+    select(func.count(CustomMetaItem.item_id)).scalar_subquery().label("meta_items"),
+)
+
 
 @router.post("/demo")
 async def create_demo_data(session: AsyncSession = Depends(get_session)):
     """Create demo data for testing and development"""
     await bootstrap_demo(session)
-    await session.commit()
+    invalidate_on_commit(session, "taxonomies", "terms", "codesets", "codes", "meta_groups", "meta_items")
 
     return {
         "message": "Demo data created successfully",
@@ -31,17 +44,8 @@ async def create_demo_data(session: AsyncSession = Depends(get_session)):
 @router.get("/status")
 async def check_bootstrap_status(session: AsyncSession = Depends(get_session)):
     """Check if demo data exists"""
-    from sqlalchemy import func, select
-
-    from app.models.codeset import CodeSet
-    from app.models.meta_types import CustomMetaGroup, CustomMetaItem
-    from app.models.taxonomy import Taxonomy
-
-    # Count existing data
-    taxonomy_count = (await session.execute(select(func.count(Taxonomy.taxonomy_id)))).scalar()
-    codeset_count = (await session.execute(select(func.count(CodeSet.codeset_id)))).scalar()
-    meta_group_count = (await session.execute(select(func.count(CustomMetaGroup.group_id)))).scalar()
-    meta_item_count = (await session.execute(select(func.count(CustomMetaItem.item_id)))).scalar()
+    counts = (await session.execute(_STATUS_COUNTS)).one()
+    taxonomy_count, codeset_count, meta_group_count, meta_item_count = counts
 
     # Meta types are now basic kinds - count from MetaTypeKind
     meta_type_count = len(MetaTypeKind)
@@ -1,99 +1,95 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import bindparam, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_session
+from app.core.cache import cached, invalidate_on_commit
+from app.core.deps import get_session, get_stream_session
+from app.core.responses import json_response, rows_json
+from app.core.streaming import stream_ndjson
+from app.db.base import new_uuid, utcnow
 from app.models.codeset import Code, CodeSet, CodeVersion
 from app.schemas.base import CodeCreate, CodeOut, CodeSetCreate, CodeSetOut
+from app.services.utils import _insert_if_absent, _insert_select_if_absent, _select_for
 
 router = APIRouter(prefix="/codeset", tags=["codeset"])
 
-
-@router.get("/", response_model=list[CodeSetOut])
+# Hot lookups are built once so SQLAlchemy's compiled cache is hit by identity
+_CODESET_BY_CODE = select(CodeSet).where(CodeSet.codeset_code == bindparam("codeset_code"))
+_CODESET_ID_BY_CODE = select(CodeSet.codeset_id).where(CodeSet.codeset_code == bindparam("codeset_code"))
+_LIST_CODESETS = _select_for(CodeSet, CodeSetOut).order_by(CodeSet.name)
+# Outer join so an existing but empty codeset still yields one row
+_LIST_CODES = (
+    _select_for(Code, CodeOut)
+    .select_from(CodeSet)
+    .outerjoin(Code, Code.codeset_id == CodeSet.codeset_id)
+    .where(CodeSet.codeset_code == bindparam("codeset_code"))
+    .order_by(Code.code_key)
+)
+_STREAM_CODES = (
+    _select_for(Code, CodeOut)
+    .where(Code.codeset_id == bindparam("codeset_id"))
+    .order_by(Code.code_key)
+)
+
+
+@router.get("/", responses={200: {"model": list[CodeSetOut]}})
+@cached("codesets")
 async def list_codesets(session: AsyncSession = Depends(get_session)):
     """Get all codesets"""
-    result = await session.execute(select(CodeSet).order_by(CodeSet.name))
-    codesets = result.scalars().all()
-    return [CodeSetOut(
-        codeset_id=cs.codeset_id,
-        codeset_code=cs.codeset_code,
-        name=cs.name,
-        description=cs.description,
-        created_at=cs.created_at
-    ) for cs in codesets]
+    rows = (await session.execute(_LIST_CODESETS)).all()
+    return json_response(rows_json(rows))
 
 
 @router.get("/{codeset_code}", response_model=CodeSetOut)
 async def get_codeset(codeset_code: str, session: AsyncSession = Depends(get_session)):
     """Get a specific codeset by code"""
-    result = await session.execute(
-        select(CodeSet).where(CodeSet.codeset_code == codeset_code)
-    )
+    result = await session.execute(_CODESET_BY_CODE, {"codeset_code": codeset_code})
     codeset = result.scalar_one_or_none()
     if not codeset:
         raise HTTPException(404, "codeset not found")
 
-    return CodeSetOut(
-        codeset_id=codeset.codeset_id,
-        codeset_code=codeset.codeset_code,
-        name=codeset.name,
-        description=codeset.description,
-        created_at=codeset.created_at
-    )
+    return codeset
 
 
 @router.post("/", response_model=CodeSetOut)
 async def create_codeset(data: CodeSetCreate, session: AsyncSession = Depends(get_session)):
     """Create a new codeset"""
-    # Check if codeset_code already exists
-    existing = await session.execute(
-        select(CodeSet).where(CodeSet.codeset_code == data.codeset_code)
-    )
-    if existing.scalar_one_or_none():
-        raise HTTPException(400, f"codeset with code '{data.codeset_code}' already exists")
-
-    codeset = CodeSet(
+    codeset = await _insert_if_absent(
+        session,
+        CodeSet,
+        ["codeset_code"],
         codeset_code=data.codeset_code,
         name=data.name,
-        description=data.description
-    )
-    session.add(codeset)
-    await session.commit()
-    await session.refresh(codeset)
-
-    return CodeSetOut(
-        codeset_id=codeset.codeset_id,
-        codeset_code=codeset.codeset_code,
-        name=codeset.name,
-        description=codeset.description,
-        created_at=codeset.created_at
+        description=data.description,
     )
+    if codeset is None:
+        raise HTTPException(400, f"codeset with code '{data.codeset_code}' already exists")
+
+    invalidate_on_commit(session, "codesets")
+
+    return codeset
 
 
-@router.get("/{codeset_code}/codes", response_model=list[CodeOut])
+@router.get("/{codeset_code}/codes", responses={200: {"model": list[CodeOut]}})
+@cached("codes")
 async def list_codes(codeset_code: str, session: AsyncSession = Depends(get_session)):
     """Get all codes in a codeset"""
-    # First find the codeset
-    codeset_result = await session.execute(
-        select(CodeSet).where(CodeSet.codeset_code == codeset_code)
-    )
-    codeset = codeset_result.scalar_one_or_none()
-    if not codeset:
+    rows = (await session.execute(_LIST_CODES, {"codeset_code": codeset_code})).all()
+    if not rows:
         raise HTTPException(404, "codeset not found")
 
-    # Get codes
-    result = await session.execute(
-        select(Code).where(Code.codeset_id == codeset.codeset_id).order_by(Code.code_key)
-    )
-    codes = result.scalars().all()
+    return json_response(rows_json(row for row in rows if row.code_id is not None))
 
-    return [CodeOut(
-        code_id=code.code_id,
-        code_key=code.code_key,
-        codeset_id=code.codeset_id,
-        current_version_id=code.current_version_id,
-        created_at=code.created_at
-    ) for code in codes]
+
+@router.get("/{codeset_code}/codes/stream", response_class=StreamingResponse)
+async def stream_codes(codeset_code: str, session: AsyncSession = Depends(get_stream_session)):
+    """Stream all codes in a codeset as newline-delimited JSON"""
+    codeset_id = (await session.execute(_CODESET_ID_BY_CODE, {"codeset_code": codeset_code})).scalar_one_or_none()
+    if codeset_id is None:
+        raise HTTPException(404, "codeset not found")
+
+    return stream_ndjson(session, _STREAM_CODES, {"codeset_id": codeset_id})
 
 
 @router.post("/{codeset_code}/codes", response_model=CodeOut)
@@ -103,50 +99,40 @@ async def create_code(
     session: AsyncSession = Depends(get_session)
 ):
     """Create a new code in a codeset"""
-    # Find the codeset
-    codeset_result = await session.execute(
-        select(CodeSet).where(CodeSet.codeset_code == codeset_code)
-    )
-    codeset = codeset_result.scalar_one_or_none()
-    if not codeset:
-        raise HTTPException(404, "codeset not found")
-
-    # Check if code_key already exists in this codeset
-    existing = await session.execute(
-        select(Code).where(
-            Code.codeset_id == codeset.codeset_id,
-            Code.code_key == data.code_key
-        )
+    # Version ids are generated client-side, so the code row can point at its
+    # initial version up front instead of flushing and updating it afterwards
+    version_id = new_uuid() if data.label_default else None
+
+    # Resolve the codeset inside the INSERT itself; the (codeset_id, code_key)
+    # unique constraint rejects duplicates
+    code = await _insert_select_if_absent(
+        session,
+        Code,
+        ["codeset_id", "code_key"],
+        select(
+            literal(new_uuid(), Code.code_id.type).label("code_id"),
+            CodeSet.codeset_id,
+            literal(data.code_key, Code.code_key.type).label("code_key"),
+            literal(version_id, Code.current_version_id.type).label("current_version_id"),
+            literal(utcnow(), Code.created_at.type).label("created_at"),
+        ).where(CodeSet.codeset_code == codeset_code),
     )
-    if existing.scalar_one_or_none():
+    if code is None:
+        # Only the failure path pays for telling the two cases apart
+        codeset_exists = (await session.execute(_CODESET_ID_BY_CODE, {"codeset_code": codeset_code})).first()
+        if not codeset_exists:
+            raise HTTPException(404, "codeset not found")
         raise HTTPException(400, f"code with key '{data.code_key}' already exists in this codeset")
 
-    # Create code
-    code = Code(
-        codeset_id=codeset.codeset_id,
-        code_key=data.code_key
-    )
-    session.add(code)
-    await session.flush()  # Get the code_id
-
     # Create initial version if label provided
-    if data.label_default:
-        version = CodeVersion(
+    if version_id:
+        session.add(CodeVersion(
+            code_version_id=version_id,
             code_id=code.code_id,
             version_no=1,
             label_default=data.label_default
-        )
-        session.add(version)
-        await session.flush()
-        code.current_version_id = version.code_version_id
-
-    await session.commit()
-    await session.refresh(code)
-
-    return CodeOut(
-        code_id=code.code_id,
-        code_key=code.code_key,
-        codeset_id=code.codeset_id,
-        current_version_id=code.current_version_id,
-        created_at=code.created_at
-    )
+        ))
+
+    invalidate_on_commit(session, "codes")
+
+    return code
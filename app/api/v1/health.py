@@ -1,11 +1,28 @@
-from fastapi import APIRouter
+import time
+
+import orjson
+from fastapi import APIRouter, Response
 
 from app.db.base import utcnow
 
 router = APIRouter(tags=["health"])
 
+# Serialized payload, refreshed at most once per second
+_HEALTH_TTL = 1.0
+_health_bytes = b""
+_health_expires = 0.0
+
+
+def _health_payload() -> bytes:
+    global _health_bytes, _health_expires
+    now = time.monotonic()
+    if now >= _health_expires:
+        _health_bytes = orjson.dumps({"ok": True, "ts": utcnow().isoformat()})
+        _health_expires = now + _HEALTH_TTL
+    return _health_bytes
+
 
 @router.get("/health")
 async def health():
     """Health check endpoint"""
-    return {"ok": True, "ts": utcnow().isoformat()}
+    return Response(_health_payload(), media_type="application/json")
@@ -1,14 +1,18 @@
 """
 Meta Types API - now code-based instead of database-based
 """
-from datetime import datetime
-
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, exists, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_session
-from app.core.meta_types import MetaTypeKind, get_all_meta_type_kinds
+from app.core.cache import cached, invalidate_on_commit
+from app.core.deps import get_session, get_stream_session
+from app.core.meta_types import get_all_meta_type_kinds, validate_meta_type_kind
+from app.core.responses import json_response, rows_json
+from app.core.streaming import stream_ndjson
+from app.db.base import is_uuid, new_uuid, utcnow
 from app.models.meta_types import CustomMetaGroup, CustomMetaItem
 from app.schemas.base import (
     MetaGroupCreate,
@@ -17,194 +21,170 @@ from app.schemas.base import (
     MetaItemOut,
     MetaTypeOut,
 )
+from app.services.meta_value_service import invalidate_meta_items_on_commit
+from app.services.utils import _insert_if_absent, _insert_select_if_absent, _select_for
 
 router = APIRouter(prefix="/meta", tags=["meta-types"])
 
+# Lookups by natural key, bound per request
+_GROUP_BY_CODE = select(CustomMetaGroup).where(CustomMetaGroup.group_code == bindparam("group_code"))
+_ITEM_BY_CODE = select(CustomMetaItem).where(CustomMetaItem.item_code == bindparam("item_code"))
+_LIST_GROUPS = _select_for(CustomMetaGroup, MetaGroupOut).order_by(CustomMetaGroup.display_name)
+_LIST_ITEMS = _select_for(CustomMetaItem, MetaItemOut).order_by(CustomMetaItem.display_name)
+
 
 # MetaType endpoints - return basic type kinds only
+# Type kinds are fixed in code, so both responses are built once at import time
+_META_TYPES_CREATED_AT = utcnow()
+_META_TYPES: dict[str, MetaTypeOut] = {
+    kind.value: MetaTypeOut(
+        type_id=kind.value,
+        type_code=kind.value,
+        name=kind.value.title(),  # PRIMITIVE -> Primitive
+        type_kind=kind.value,
+        schema_json=None,
+        created_at=_META_TYPES_CREATED_AT,
+    )
+    for kind in get_all_meta_type_kinds()
+}
+_META_TYPES_JSON = TypeAdapter(list[MetaTypeOut]).dump_json(list(_META_TYPES.values()))
+_META_TYPE_JSON: dict[str, bytes] = {
+    code: meta_type.model_dump_json().encode() for code, meta_type in _META_TYPES.items()
+}
+
+
 @router.get("/types", response_model=list[MetaTypeOut])
 async def list_meta_types():
     """Get all supported meta type kinds"""
-    return [
-        MetaTypeOut(
-            type_id=kind.value,
-            type_code=kind.value,
-            name=kind.value.title(),  # PRIMITIVE -> Primitive
-            type_kind=kind.value,
-            schema_json=None,
-            created_at=datetime.utcnow()
-        ) for kind in get_all_meta_type_kinds()
-    ]
+    return Response(_META_TYPES_JSON, media_type="application/json")
 
 
 @router.get("/types/{type_code}", response_model=MetaTypeOut)
 async def get_meta_type(type_code: str):
     """Get a specific meta type kind by code"""
-    try:
-        kind = MetaTypeKind(type_code.upper())
-    except ValueError:
+    body = _META_TYPE_JSON.get(type_code.upper())
+    if body is None:
         raise HTTPException(404, f"Meta type '{type_code}' not found")
-
-    return MetaTypeOut(
-        type_id=kind.value,
-        type_code=kind.value,
-        name=kind.value.title(),
-        type_kind=kind.value,
-        schema_json=None,
-        created_at=datetime.utcnow()
-    )
+    return Response(body, media_type="application/json")
 
 
 
 # MetaGroup endpoints - still database-based
-@router.get("/groups", response_model=list[MetaGroupOut])
+@router.get("/groups", responses={200: {"model": list[MetaGroupOut]}})
+@cached("meta_groups")
 async def list_meta_groups(session: AsyncSession = Depends(get_session)):
     """Get all meta groups"""
-    result = await session.execute(select(CustomMetaGroup).order_by(CustomMetaGroup.display_name))
-    groups = result.scalars().all()
-    return [MetaGroupOut(
-        group_id=g.group_id,
-        group_code=g.group_code,
-        display_name=g.display_name,
-        sort_order=g.sort_order,
-        created_at=g.created_at
-    ) for g in groups]
+    rows = (await session.execute(_LIST_GROUPS)).all()
+    return json_response(rows_json(rows))
 
 
 @router.get("/groups/{group_code}", response_model=MetaGroupOut)
 async def get_meta_group(group_code: str, session: AsyncSession = Depends(get_session)):
     """Get a specific meta group by code"""
-    result = await session.execute(
-        select(CustomMetaGroup).where(CustomMetaGroup.group_code == group_code)
-    )
+    result = await session.execute(_GROUP_BY_CODE, {"group_code": group_code})
     group = result.scalar_one_or_none()
     if not group:
         raise HTTPException(404, "meta group not found")
 
-    return MetaGroupOut(
-        group_id=group.group_id,
-        group_code=group.group_code,
-        display_name=group.display_name,
-        sort_order=group.sort_order,
-        created_at=group.created_at
-    )
+    return group
 
 
 @router.post("/groups", response_model=MetaGroupOut)
 async def create_meta_group(data: MetaGroupCreate, session: AsyncSession = Depends(get_session)):
     """Create a new meta group"""
-    # Check if group code already exists
-    result = await session.execute(
-        select(CustomMetaGroup).where(CustomMetaGroup.group_code == data.group_code)
-    )
-    if result.scalar_one_or_none():
-        raise HTTPException(400, f"Meta group '{data.group_code}' already exists")
-
-    group = CustomMetaGroup(
+    group = await _insert_if_absent(
+        session,
+        CustomMetaGroup,
+        ["group_code"],
         group_code=data.group_code,
         display_name=data.display_name,
-        sort_order=data.sort_order or 0
-    )
-    session.add(group)
-    await session.commit()
-
-    return MetaGroupOut(
-        group_id=group.group_id,
-        group_code=group.group_code,
-        display_name=group.display_name,
-        sort_order=group.sort_order,
-        created_at=group.created_at
+        sort_order=data.sort_order or 0,
     )
+    if group is None:
+        raise HTTPException(400, f"Meta group '{data.group_code}' already exists")
+
+    invalidate_on_commit(session, "meta_groups")
+
+    return group
 
 
 # MetaItem endpoints - now with type_kind instead of type_id
-@router.get("/items", response_model=list[MetaItemOut])
+@router.get("/items", responses={200: {"model": list[MetaItemOut]}})
+@cached("meta_items")
 async def list_meta_items(session: AsyncSession = Depends(get_session)):
     """Get all meta items"""
-    result = await session.execute(
-        select(CustomMetaItem).options(
-            # No need to load type relationship anymore
-        ).order_by(CustomMetaItem.display_name)
-    )
-    items = result.scalars().all()
-    return [MetaItemOut(
-        item_id=item.item_id,
-        item_code=item.item_code,
-        display_name=item.display_name,
-        group_id=item.group_id,
-        type_kind=item.type_kind,
-        is_required=item.is_required,
-        default_json=item.default_json,
-        selection_mode=item.selection_mode,
-        created_at=item.created_at
-    ) for item in items]
+    rows = (await session.execute(_LIST_ITEMS)).all()
+    return json_response(rows_json(rows))
+
+
+@router.get("/items/stream", response_class=StreamingResponse)
+async def stream_meta_items(session: AsyncSession = Depends(get_stream_session)):
+    """Stream all meta items as newline-delimited JSON"""
+    return stream_ndjson(session, _LIST_ITEMS)
 
 
 @router.get("/items/{item_code}", response_model=MetaItemOut)
 async def get_meta_item(item_code: str, session: AsyncSession = Depends(get_session)):
     """Get a specific meta item by code"""
-    result = await session.execute(
-        select(CustomMetaItem).where(CustomMetaItem.item_code == item_code)
-    )
+    result = await session.execute(_ITEM_BY_CODE, {"item_code": item_code})
     item = result.scalar_one_or_none()
     if not item:
         raise HTTPException(404, "meta item not found")
 
-    return MetaItemOut(
-        item_id=item.item_id,
-        item_code=item.item_code,
-        display_name=item.display_name,
-        group_id=item.group_id,
-        type_kind=item.type_kind,
-        is_required=item.is_required,
-        default_json=item.default_json,
-        selection_mode=item.selection_mode,
-        created_at=item.created_at
-    )
+    return item
 
 
-@router.post("/items", response_model=MetaItemOut)
-async def create_meta_item(data: MetaItemCreate, session: AsyncSession = Depends(get_session)):
-    """Create a new meta item"""
-    # Check if item code already exists
-    result = await session.execute(
-        select(CustomMetaItem).where(CustomMetaItem.item_code == data.item_code)
-    )
-    if result.scalar_one_or_none():
-        raise HTTPException(400, f"Meta item '{data.item_code}' already exists")
+# Item codes that would be shadowed by the fixed GET /meta/items/stream and
+# /meta-values/{target_type}/{target_id}/{stream,unified} routes
+_RESERVED_ITEM_CODES = frozenset({"stream", "unified"})
 
-    # Validate group exists
-    group_result = await session.execute(
-        select(CustomMetaGroup).where(CustomMetaGroup.group_id == data.group_id)
-    )
-    if not group_result.scalar_one_or_none():
-        raise HTTPException(400, f"Meta group '{data.group_id}' not found")
 
-    # Validate type_kind is valid
-    from app.core.meta_types import validate_meta_type_kind
+async def _validated_meta_item(data: MetaItemCreate) -> MetaItemCreate:
+    """Reject unknown type kinds and reserved codes before a session is set up for the request"""
     if not validate_meta_type_kind(data.type_kind):
         raise HTTPException(400, f"Invalid type_kind: {data.type_kind}")
+    if data.item_code in _RESERVED_ITEM_CODES:
+        raise HTTPException(400, f"Meta item code '{data.item_code}' is reserved")
+    return data
 
-    item = CustomMetaItem(
-        item_code=data.item_code,
-        display_name=data.display_name,
-        group_id=data.group_id,
-        type_kind=data.type_kind,
-        is_required=data.is_required or False,
-        selection_mode=data.selection_mode or "SINGLE",
-        default_json=data.default_json
-    )
-    session.add(item)
-    await session.commit()
-
-    return MetaItemOut(
-        item_id=item.item_id,
-        item_code=item.item_code,
-        display_name=item.display_name,
-        group_id=item.group_id,
-        type_kind=item.type_kind,
-        is_required=item.is_required,
-        default_json=item.default_json,
-        selection_mode=item.selection_mode,
-        created_at=item.created_at
+
+@router.post("/items", response_model=MetaItemOut)
+async def create_meta_item(
+    data: MetaItemCreate = Depends(_validated_meta_item),
+    session: AsyncSession = Depends(get_session),
+):
+    """Create a new meta item"""
+    # A malformed id can't name a group, and PostgreSQL rejects it as a uuid
+    if not is_uuid(data.group_id):
+        raise HTTPException(400, f"Meta group '{data.group_id}' not found")
+    # The group must exist for the SELECT to produce a row, so the insert
+    # doubles as the group check
+    item = await _insert_select_if_absent(
+        session,
+        CustomMetaItem,
+        ["item_code"],
+        select(
+            literal(new_uuid(), CustomMetaItem.item_id.type).label("item_id"),
+            literal(data.item_code, CustomMetaItem.item_code.type).label("item_code"),
+            literal(data.display_name, CustomMetaItem.display_name.type).label("display_name"),
+            CustomMetaGroup.group_id,
+            literal(data.type_kind, CustomMetaItem.type_kind.type).label("type_kind"),
+            literal(data.is_required or False, CustomMetaItem.is_required.type).label("is_required"),
+            literal(data.default_json, CustomMetaItem.default_json.type).label("default_json"),
+            literal(data.selection_mode or "SINGLE", CustomMetaItem.selection_mode.type).label("selection_mode"),
+            literal(utcnow(), CustomMetaItem.created_at.type).label("created_at"),
+        ).where(CustomMetaGroup.group_id == data.group_id),
     )
+    if item is None:
+        # Only the failure path pays for telling the two cases apart
+        group_exists = (
+            await session.execute(select(exists().where(CustomMetaGroup.group_id == data.group_id)))
+        ).scalar_one()
+        if not group_exists:
+            raise HTTPException(400, f"Meta group '{data.group_id}' not found")
+        raise HTTPException(400, f"Meta item '{data.item_code}' already exists")
+
+    invalidate_on_commit(session, "meta_items")
+    invalidate_meta_items_on_commit(session)
+
+    return item
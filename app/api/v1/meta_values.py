@@ -1,30 +1,66 @@
-import json
+from collections.abc import Awaitable, Callable
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import and_, bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-
-from app.core.deps import get_session
-from app.core.meta_types import MetaTypeKind, get_meta_item_type_kind
+from sqlalchemy.orm import joinedload, raiseload
+
+from app.core.cache import cached, meta_values_namespace, response_cache
+from app.core.deps import get_session, get_stream_session
+from app.core.meta_types import META_ITEM_TYPE_KINDS, MetaTypeKind
+from app.core.responses import (
+    JSON_OPTIONS,
+    conditional_json_response,
+    json_response,
+    make_etag,
+)
+from app.core.streaming import stream_ndjson_objects
 from app.models.meta_types import CustomMetaItem
 from app.models.meta_values import (
     CustomMetaValue,
     CustomMetaValueVersion,
 )
 from app.schemas.base import (
-    MetaValueVersionOut,
     MetaValueWithVersionOut,
 )
 from app.services.meta_value_service import (
     get_meta_value_unified,
+    parse_value_json,
     set_meta_value_unified,
+    version_value_data,
 )
 
 router = APIRouter(prefix="/meta-values", tags=["meta-values"])
 
+# A target's values with their item and current version; both relationships
+# are many-to-one, so JOINs load them in the same query. Listed in the order
+# the values were first set.
+_VALUES_FOR_TARGET = select(CustomMetaValue).options(
+    joinedload(CustomMetaValue.item, innerjoin=True),
+    joinedload(CustomMetaValue.current_version),
+    raiseload("*"),
+).where(
+    CustomMetaValue.target_type == bindparam("target_type"),
+    CustomMetaValue.target_id == bindparam("target_id"),
+).order_by(CustomMetaValue.created_at)
+# Item, value and current version in one query; the outer join keeps the
+# item row when the target has no value for it
+_ITEM_WITH_VALUE = select(CustomMetaItem, CustomMetaValue).outerjoin(
+    CustomMetaValue,
+    and_(
+        CustomMetaValue.item_id == CustomMetaItem.item_id,
+        CustomMetaValue.target_type == bindparam("target_type"),
+        CustomMetaValue.target_id == bindparam("target_id"),
+    ),
+).options(
+    joinedload(CustomMetaValue.current_version),
+    raiseload("*"),
+).where(CustomMetaItem.item_code == bindparam("item_code"))
+
 
 class MetaValueUnified(BaseModel):
     """Unified meta value input model."""
@@ -45,19 +81,102 @@ class MetaValueResponse(BaseModel):
     value_data: dict[str, Any]
 
 
-async def _parse_version_data_v2(session: AsyncSession, version: CustomMetaValueVersion, item_type_kind: MetaTypeKind) -> dict:
+# MetaValueUnified field carrying the value for each type
+_PAYLOAD_FIELDS = {
+    "PRIMITIVE": "value",
+    "STRING": "value",
+    "CODESET": "code_key",
+    "TAXONOMY": "term_keys",
+}
+
+
+def _parse_version_data(version: CustomMetaValueVersion) -> dict:
     """Parse version data from value_json (unified format)"""
     if not version.value_json:
         return {}
 
     try:
-        data = json.loads(version.value_json)
+        data = parse_value_json(version)
         return data
-    except (json.JSONDecodeError, KeyError):
+    except (orjson.JSONDecodeError, KeyError):
         return {}
 
 
-@router.put("/{target_type}/{target_id}/{item_code}")
+def _version_payload(version: CustomMetaValueVersion, item_type_kind: str) -> dict[str, Any]:
+    """Flatten a version's unified value_json into the MetaValueVersionOut fields"""
+    data = _parse_version_data(version)
+    term_keys = data.get("term_keys") or []
+    term_display_names = data.get("term_display_names") or []
+    single_term_key = term_keys[0] if len(term_keys) == 1 else None
+
+    return {
+        "version_id": version.version_id,
+        "version_no": version.version_no,
+        "value_json": data.get("value") if item_type_kind == MetaTypeKind.PRIMITIVE else None,
+        "value_string": data.get("value") if item_type_kind == MetaTypeKind.STRING else None,
+        "code_id": data.get("code_id"),
+        "code_key": data.get("code_key"),
+        "code_label": data.get("code_label"),
+        "taxonomy_term_id": single_term_key,
+        "term_key": single_term_key,
+        "term_display_name": term_display_names[0] if len(term_display_names) == 1 else None,
+        "term_keys": term_keys if len(term_keys) > 1 else None,
+        "term_display_names": term_display_names if len(term_display_names) > 1 else None,
+        "valid_from": version.valid_from,
+        "valid_to": version.valid_to,
+        "author": version.author,
+        "reason": version.reason,
+    }
+
+
+def _meta_value_payload(meta_value: CustomMetaValue, item: CustomMetaItem) -> dict[str, Any]:
+    """Build a MetaValueWithVersionOut-shaped dict from loaded rows"""
+    current_version_data = None
+    if meta_value.current_version:
+        # Fallback to database type for unknown items
+        item_type_kind = META_ITEM_TYPE_KINDS.get(item.item_code, item.type_kind)
+        current_version_data = _version_payload(meta_value.current_version, item_type_kind)
+
+    return {
+        "value_id": meta_value.value_id,
+        "target_type": meta_value.target_type,
+        "target_id": meta_value.target_id,
+        "item_id": meta_value.item_id,
+        "item_code": item.item_code,
+        "item_display_name": item.display_name,
+        "type_kind": item.type_kind,
+        "created_at": meta_value.created_at,
+        "current_version": current_version_data,
+    }
+
+
+def _target_namespace(target_type: str, target_id: str, **_: Any) -> str:
+    """meta_values_namespace() of a meta value endpoint's keyword arguments"""
+    return meta_values_namespace(target_type, target_id)
+
+
+async def _cached_etag_body(
+    target_type: str,
+    target_id: str,
+    cache_key: tuple[str, ...],
+    load: Callable[[], Awaitable[tuple[str, bytes]]],
+) -> tuple[str, bytes]:
+    """
+    (etag, body) of a conditional GET, kept in the target's cache namespace
+
+    set_meta_value_unified invalidates the namespace on commit. Errors raised
+    by load() are not cached.
+    """
+    namespace = meta_values_namespace(target_type, target_id)
+    entry = response_cache.get(namespace, cache_key)
+    if entry is None:
+        entry = await load()
+        response_cache.set(namespace, cache_key, entry)
+    return entry
+
+
+# get_session only opens the request's transaction; the service picks it up from context
+@router.put("/{target_type}/{target_id}/{item_code}", dependencies=[Depends(get_session)])
 async def set_meta_value(
     target_type: str,
     target_id: str,
@@ -67,27 +186,18 @@ async def set_meta_value(
     """Set a meta value using unified JSON structure."""
     try:
         # Convert input to unified format
-        value_data = {"type": data.type}
-
-        if data.type in ["PRIMITIVE", "STRING"]:
-            if data.value is None:
-                raise HTTPException(400, f"{data.type} requires 'value' field")
-            value_data["value"] = data.value
-
-        elif data.type == "CODESET":
-            if data.code_key is None:
-                raise HTTPException(400, "CODESET requires 'code_key' field")
-            value_data["code_key"] = data.code_key
-
-        elif data.type == "TAXONOMY":
-            if data.term_keys is None or len(data.term_keys) == 0:
-                raise HTTPException(400, "TAXONOMY requires 'term_keys' field")
-            value_data["term_keys"] = data.term_keys
-            value_data["selection_mode"] = data.selection_mode or "SINGLE"
-
-        else:
+        field = _PAYLOAD_FIELDS.get(data.type)
+        if field is None:
             raise HTTPException(400, f"Invalid type: {data.type}")
 
+        value = getattr(data, field)
+        if value is None or (data.type == "TAXONOMY" and not value):
+            raise HTTPException(400, f"{data.type} requires '{field}' field")
+
+        value_data = {"type": data.type, field: value}
+        if data.type == "TAXONOMY":
+            value_data["selection_mode"] = data.selection_mode or "SINGLE"
+
         version_id = await set_meta_value_unified(
             target_type=target_type,
             target_id=target_id,
@@ -104,7 +214,8 @@ async def set_meta_value(
         raise HTTPException(500, f"Failed to set meta value: {str(e)}")
 
 
-@router.get("/{target_type}/{target_id}/{item_code}/unified", response_model=MetaValueResponse)
+@router.get("/{target_type}/{target_id}/{item_code}/unified", responses={200: {"model": MetaValueResponse}})
+@cached(_target_namespace)
 async def get_unified_meta_value(
     target_type: str,
     target_id: str,
@@ -123,12 +234,12 @@ async def get_unified_meta_value(
         if not value_data:
             raise HTTPException(404, "Meta value not found")
 
-        return MetaValueResponse(
-            target_type=target_type,
-            target_id=target_id,
-            item_code=item_code,
-            value_data=value_data
-        )
+        return json_response(orjson.dumps({
+            "target_type": target_type,
+            "target_id": target_id,
+            "item_code": item_code,
+            "value_data": value_data,
+        }, option=JSON_OPTIONS))
 
     except HTTPException:
         raise
@@ -136,7 +247,8 @@ async def get_unified_meta_value(
         raise HTTPException(500, f"Failed to get meta value: {str(e)}")
 
 
-@router.get("/{target_type}/{target_id}/unified", response_model=list[MetaValueResponse])
+@router.get("/{target_type}/{target_id}/unified", responses={200: {"model": list[MetaValueResponse]}})
+@cached(_target_namespace)
 async def get_all_unified_meta_values(
     target_type: str,
     target_id: str,
@@ -144,205 +256,100 @@ async def get_all_unified_meta_values(
 ):
     """Get all meta values for a target in unified JSON format."""
     try:
-        from sqlalchemy import select
-
-        from app.models.meta_types import CustomMetaItem
-
-        # Get all meta items to check for values
-        items = (await session.execute(select(CustomMetaItem))).scalars().all()
+        result = await session.execute(_VALUES_FOR_TARGET, {"target_type": target_type, "target_id": target_id})
 
         results = []
-        for item in items:
-            value_data = await get_meta_value_unified(
-                session,
-                target_type=target_type,
-                target_id=target_id,
-                item_code=item.item_code
-            )
+        for meta_value in result.scalars():
+            if not meta_value.current_version:
+                continue
+            value_data = await version_value_data(session, meta_value.current_version, meta_value.item)
 
             if value_data:
-                results.append(MetaValueResponse(
-                    target_type=target_type,
-                    target_id=target_id,
-                    item_code=item.item_code,
-                    value_data=value_data
-                ))
+                results.append({
+                    "target_type": target_type,
+                    "target_id": target_id,
+                    "item_code": meta_value.item.item_code,
+                    "value_data": value_data,
+                })
 
-        return results
+        return json_response(orjson.dumps(results, option=JSON_OPTIONS))
 
     except Exception as e:
         raise HTTPException(500, f"Failed to get meta values: {str(e)}")
 
 
 
-@router.get("/{target_type}/{target_id}", response_model=list[MetaValueWithVersionOut])
+@router.get("/{target_type}/{target_id}", responses={200: {"model": list[MetaValueWithVersionOut]}})
 async def get_meta_values_for_target(
     target_type: str,
     target_id: str,
+    request: Request,
     session: AsyncSession = Depends(get_session)
 ):
     """Get all meta values for a specific target"""
-    try:
-        # Query meta values with their current versions and related data
-        stmt = select(CustomMetaValue).options(
-            selectinload(CustomMetaValue.item),  # No need to load type relationship anymore
-            selectinload(CustomMetaValue.current_version)
-        ).where(
-            CustomMetaValue.target_type == target_type,
-            CustomMetaValue.target_id == target_id
-        )
-
-        result = await session.execute(stmt)
+    async def load() -> tuple[str, bytes]:
+        result = await session.execute(_VALUES_FOR_TARGET, {"target_type": target_type, "target_id": target_id})
         meta_values = result.scalars().all()
 
-        response_values = []
-
-        for meta_value in meta_values:
-            # Get current version details
-            current_version_data = None
-            if meta_value.current_version_id:
-                # Get the current version with all related data
-                version_stmt = select(CustomMetaValueVersion).where(
-                    CustomMetaValueVersion.version_id == meta_value.current_version_id
-                )
-                version_result = await session.execute(version_stmt)
-                current_version = version_result.scalar_one_or_none()
-
-                if current_version:
-                    # Use unified parsing from V2 service
-                    try:
-                        item_type_kind = get_meta_item_type_kind(meta_value.item.item_code)
-                    except ValueError:
-                        # Fallback to database type for unknown items
-                        item_type_kind = meta_value.item.type_kind
-
-                    parsed_data = await _parse_version_data_v2(session, current_version, item_type_kind)
-
-                    # Build version data in V1 format
-                    version_data = {
-                        "version_id": current_version.version_id,
-                        "version_no": current_version.version_no,
-                        "valid_from": current_version.valid_from,
-                        "valid_to": current_version.valid_to,
-                        "author": current_version.author,
-                        "reason": current_version.reason,
-                        "value_json": parsed_data.get("value") if item_type_kind == MetaTypeKind.PRIMITIVE else None,
-                        "value_string": parsed_data.get("value") if item_type_kind == MetaTypeKind.STRING else None,
-                        "code_id": parsed_data.get("code_id"),
-                        "code_key": parsed_data.get("code_key"),
-                        "code_label": parsed_data.get("code_label"),
-                        "taxonomy_term_id": parsed_data.get("term_keys", [None])[0] if parsed_data.get("term_keys") and len(parsed_data.get("term_keys", [])) == 1 else None,
-                        "term_key": parsed_data.get("term_keys", [None])[0] if parsed_data.get("term_keys") and len(parsed_data.get("term_keys", [])) == 1 else None,
-                        "term_display_name": parsed_data.get("term_display_names", [None])[0] if parsed_data.get("term_display_names") and len(parsed_data.get("term_display_names", [])) == 1 else None,
-                        "term_keys": parsed_data.get("term_keys") if parsed_data.get("term_keys") and len(parsed_data.get("term_keys", [])) > 1 else None,
-                        "term_display_names": parsed_data.get("term_display_names") if parsed_data.get("term_display_names") and len(parsed_data.get("term_display_names", [])) > 1 else None,
-                    }
-
-                    current_version_data = MetaValueVersionOut(**version_data)
-
-            # Build response object
-            response_value = MetaValueWithVersionOut(
-                value_id=meta_value.value_id,
-                target_type=meta_value.target_type,
-                target_id=meta_value.target_id,
-                item_id=meta_value.item_id,
-                item_code=meta_value.item.item_code,
-                item_display_name=meta_value.item.display_name,
-                type_kind=meta_value.item.type_kind,
-                created_at=meta_value.created_at,
-                current_version=current_version_data
-            )
-            response_values.append(response_value)
-
-        return response_values
+        # Every write creates a new current version, so the version ids identify the body
+        etag = make_etag(
+            part for meta_value in meta_values for part in (meta_value.value_id, meta_value.current_version_id)
+        )
+        body = orjson.dumps(
+            [_meta_value_payload(meta_value, meta_value.item) for meta_value in meta_values],
+            option=JSON_OPTIONS,
+        )
+        return etag, body
+
+    try:
+        etag, body = await _cached_etag_body(target_type, target_id, ("list",), load)
+        return conditional_json_response(request, etag, lambda: body)
 
     except Exception as e:
         raise HTTPException(500, f"Failed to retrieve meta values: {str(e)}")
 
 
-@router.get("/{target_type}/{target_id}/{item_code}", response_model=MetaValueWithVersionOut)
+@router.get("/{target_type}/{target_id}/stream", response_class=StreamingResponse)
+async def stream_meta_values_for_target(
+    target_type: str,
+    target_id: str,
+    session: AsyncSession = Depends(get_stream_session)
+):
+    """Stream all meta values for a target as newline-delimited JSON"""
+    return stream_ndjson_objects(
+        session,
+        _VALUES_FOR_TARGET,
+        lambda meta_value: _meta_value_payload(meta_value, meta_value.item),
+        {"target_type": target_type, "target_id": target_id},
+    )
+
+
+@router.get("/{target_type}/{target_id}/{item_code}", responses={200: {"model": MetaValueWithVersionOut}})
 async def get_meta_value_for_target_and_item(
     target_type: str,
     target_id: str,
     item_code: str,
+    request: Request,
     session: AsyncSession = Depends(get_session)
 ):
     """Get a specific meta value for target and item"""
-    try:
-        # First get the item by code
-        item_stmt = select(CustomMetaItem).where(CustomMetaItem.item_code == item_code)
-
-        item_result = await session.execute(item_stmt)
-        item = item_result.scalar_one_or_none()
+    async def load() -> tuple[str, bytes]:
+        params = {"target_type": target_type, "target_id": target_id, "item_code": item_code}
+        row = (await session.execute(_ITEM_WITH_VALUE, params)).one_or_none()
 
-        if not item:
+        if row is None:
             raise HTTPException(404, f"Meta item '{item_code}' not found")
 
-        # Query meta value
-        stmt = select(CustomMetaValue).where(
-            CustomMetaValue.target_type == target_type,
-            CustomMetaValue.target_id == target_id,
-            CustomMetaValue.item_id == item.item_id
-        )
-
-        result = await session.execute(stmt)
-        meta_value = result.scalar_one_or_none()
-
+        item, meta_value = row
         if not meta_value:
             raise HTTPException(404, f"Meta value not found for target {target_type}:{target_id} and item {item_code}")
 
-        # Get current version details (same logic as above)
-        current_version_data = None
-        if meta_value.current_version_id:
-            version_stmt = select(CustomMetaValueVersion).where(
-                CustomMetaValueVersion.version_id == meta_value.current_version_id
-            )
-            version_result = await session.execute(version_stmt)
-            current_version = version_result.scalar_one_or_none()
-
-            if current_version:
-                # Use unified parsing from V2 service
-                try:
-                    item_type_kind = get_meta_item_type_kind(item.item_code)
-                except ValueError:
-                    # Fallback to database type for unknown items
-                    item_type_kind = item.type_kind
-
-                parsed_data = await _parse_version_data_v2(session, current_version, item_type_kind)
-
-                # Build version data in V1 format
-                version_data = {
-                    "version_id": current_version.version_id,
-                    "version_no": current_version.version_no,
-                    "valid_from": current_version.valid_from,
-                    "valid_to": current_version.valid_to,
-                    "author": current_version.author,
-                    "reason": current_version.reason,
-                    "value_json": parsed_data.get("value") if item_type_kind == MetaTypeKind.PRIMITIVE else None,
-                    "value_string": parsed_data.get("value") if item_type_kind == MetaTypeKind.STRING else None,
-                    "code_id": parsed_data.get("code_id"),
-                    "code_key": parsed_data.get("code_key"),
-                    "code_label": parsed_data.get("code_label"),
-                    "taxonomy_term_id": parsed_data.get("term_keys", [None])[0] if parsed_data.get("term_keys") and len(parsed_data.get("term_keys", [])) == 1 else None,
-                    "term_key": parsed_data.get("term_keys", [None])[0] if parsed_data.get("term_keys") and len(parsed_data.get("term_keys", [])) == 1 else None,
-                    "term_display_name": parsed_data.get("term_display_names", [None])[0] if parsed_data.get("term_display_names") and len(parsed_data.get("term_display_names", [])) == 1 else None,
-                    "term_keys": parsed_data.get("term_keys") if parsed_data.get("term_keys") and len(parsed_data.get("term_keys", [])) > 1 else None,
-                    "term_display_names": parsed_data.get("term_display_names") if parsed_data.get("term_display_names") and len(parsed_data.get("term_display_names", [])) > 1 else None,
-                }
-
-                current_version_data = MetaValueVersionOut(**version_data)
-
-        return MetaValueWithVersionOut(
-            value_id=meta_value.value_id,
-            target_type=meta_value.target_type,
-            target_id=meta_value.target_id,
-            item_id=meta_value.item_id,
-            item_code=item.item_code,
-            item_display_name=item.display_name,
-            type_kind=item.type_kind,
-            created_at=meta_value.created_at,
-            current_version=current_version_data
-        )
+        etag = make_etag((meta_value.value_id, meta_value.current_version_id))
+        return etag, orjson.dumps(_meta_value_payload(meta_value, item), option=JSON_OPTIONS)
+
+    try:
+        etag, body = await _cached_etag_body(target_type, target_id, ("item", item_code), load)
+        return conditional_json_response(request, etag, lambda: body)
 
     except HTTPException:
         raise
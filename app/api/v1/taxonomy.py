@@ -1,9 +1,12 @@
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cached, invalidate_on_commit
 from app.core.deps import get_session
+from app.core.responses import json_response, rows_json
+from app.db.base import is_uuid
 from app.models import Term as TermModel
 from app.models.taxonomy import Taxonomy
 from app.schemas.base import (
@@ -14,93 +17,77 @@ from app.schemas.base import (
     TermOut,
 )
 from app.services.term_service import upsert_term_content
+from app.services.utils import _insert_if_absent, _select_for
 
 router = APIRouter(prefix="/taxonomy", tags=["taxonomy"])
 
+# Lookups by natural key, bound per request
+_TAXONOMY_BY_CODE = select(Taxonomy).where(Taxonomy.taxonomy_code == bindparam("taxonomy_code"))
+_LIST_TAXONOMIES = _select_for(Taxonomy, TaxonomyOut).order_by(Taxonomy.name)
+# Outer join so an existing but empty taxonomy still yields one row
+_LIST_TERMS = (
+    _select_for(TermModel, TermOut)
+    .select_from(Taxonomy)
+    .outerjoin(TermModel, TermModel.taxonomy_id == Taxonomy.taxonomy_id)
+    .where(Taxonomy.taxonomy_code == bindparam("taxonomy_code"))
+    .order_by(TermModel.display_name)
+)
+
 
-@router.get("/{taxonomy_code}/terms", response_model=list[TermOut])
+@router.get("/{taxonomy_code}/terms", responses={200: {"model": list[TermOut]}})
+@cached("terms")
 async def list_terms(taxonomy_code: str, session: AsyncSession = Depends(get_session)):
     """Get all terms in a taxonomy"""
-    tax = (
-        await session.execute(select(Taxonomy).where(Taxonomy.taxonomy_code == taxonomy_code))
-    ).scalar_one_or_none()
-    if not tax:
+    rows = (await session.execute(_LIST_TERMS, {"taxonomy_code": taxonomy_code})).all()
+    if not rows:
         raise HTTPException(404, "taxonomy not found")
 
-    rows = (
-        await session.execute(select(TermModel).where(TermModel.taxonomy_id == tax.taxonomy_id).order_by(TermModel.display_name))
-    ).scalars().all()
-    return [TermOut(term_id=r.term_id, term_key=r.term_key, display_name=r.display_name, parent_term_id=r.parent_term_id) for r in rows]
+    return json_response(rows_json(row for row in rows if row.term_id is not None))
 
 
-@router.get("/", response_model=list[TaxonomyOut])
+@router.get("/", responses={200: {"model": list[TaxonomyOut]}})
+@cached("taxonomies")
 async def list_taxonomies(session: AsyncSession = Depends(get_session)):
     """Get all taxonomies"""
-    result = await session.execute(select(Taxonomy).order_by(Taxonomy.name))
-    taxonomies = result.scalars().all()
-    return [TaxonomyOut(
-        taxonomy_id=tax.taxonomy_id,
-        taxonomy_code=tax.taxonomy_code,
-        name=tax.name,
-        description=tax.description,
-        created_at=tax.created_at
-    ) for tax in taxonomies]
+    rows = (await session.execute(_LIST_TAXONOMIES)).all()
+    return json_response(rows_json(rows))
 
 
 @router.get("/{taxonomy_code}", response_model=TaxonomyOut)
 async def get_taxonomy(taxonomy_code: str, session: AsyncSession = Depends(get_session)):
     """Get a specific taxonomy by code"""
-    result = await session.execute(
-        select(Taxonomy).where(Taxonomy.taxonomy_code == taxonomy_code)
-    )
+    result = await session.execute(_TAXONOMY_BY_CODE, {"taxonomy_code": taxonomy_code})
     taxonomy = result.scalar_one_or_none()
     if not taxonomy:
         raise HTTPException(404, "taxonomy not found")
 
-    return TaxonomyOut(
-        taxonomy_id=taxonomy.taxonomy_id,
-        taxonomy_code=taxonomy.taxonomy_code,
-        name=taxonomy.name,
-        description=taxonomy.description,
-        created_at=taxonomy.created_at
-    )
+    return taxonomy
 
 
 @router.post("/", response_model=TaxonomyOut)
 async def create_taxonomy(data: TaxonomyCreate, session: AsyncSession = Depends(get_session)):
     """Create a new taxonomy"""
-    # Check if taxonomy_code already exists
-    existing = await session.execute(
-        select(Taxonomy).where(Taxonomy.taxonomy_code == data.taxonomy_code)
-    )
-    if existing.scalar_one_or_none():
-        raise HTTPException(400, f"taxonomy with code '{data.taxonomy_code}' already exists")
-
-    taxonomy = Taxonomy(
+    taxonomy = await _insert_if_absent(
+        session,
+        Taxonomy,
+        ["taxonomy_code"],
         taxonomy_code=data.taxonomy_code,
         name=data.name,
-        description=data.description
-    )
-    session.add(taxonomy)
-    await session.commit()
-    await session.refresh(taxonomy)
-
-    return TaxonomyOut(
-        taxonomy_id=taxonomy.taxonomy_id,
-        taxonomy_code=taxonomy.taxonomy_code,
-        name=taxonomy.name,
-        description=taxonomy.description,
-        created_at=taxonomy.created_at
+        description=data.description,
     )
+    if taxonomy is None:
+        raise HTTPException(400, f"taxonomy with code '{data.taxonomy_code}' already exists")
+
+    invalidate_on_commit(session, "taxonomies")
+
+    return taxonomy
 
 
 @router.put("/terms/{term_id}/content")
 async def put_term_content(term_id: str, body: TermContentIn, session: AsyncSession = Depends(get_session)):
     """Update term content with versioning"""
-    # Ensure term exists
-    term = await session.get(TermModel, term_id)
-    if not term:
+    # Ensure term exists; a malformed id can't name one, and PostgreSQL rejects it as a uuid
+    if not is_uuid(term_id) or not await session.get(TermModel, term_id):
         raise HTTPException(404, "term not found")
     vid = await upsert_term_content(term_id, TermContentUpdate(**body.model_dump()))
-    await session.commit()
     return {"content_version_id": vid}
@@ -0,0 +1,283 @@
+"""
+Process-local response cache for read-mostly catalog endpoints
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from functools import wraps
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.responses import json_response
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL channel fed by the metahub_notify_cache() triggers
+NOTIFY_CHANNEL = "metahub_cache"
+# Channel carrying '<target_type>:<target_id>' for each written meta value row
+NOTIFY_VALUES_CHANNEL = "metahub_cache_values"
+
+# Cache namespaces to drop when a notifying table changes
+TABLE_NAMESPACES: dict[str, tuple[str, ...]] = {
+    "tx_taxonomy": ("taxonomies",),
+    "tx_term": ("terms",),
+    "cm_codeset": ("codesets",),
+    "cm_code": ("codes",),
+    "custom_meta_group": ("meta_groups",),
+    "custom_meta_item": ("meta_items",),
+}
+
+# Meta value responses are cached per target, each target in its own namespace
+META_VALUES_PREFIX = "mv:"
+
+# Namespace prefixes to drop when a notifying table changes. Row writes to
+# custom_meta_value name their target on NOTIFY_VALUES_CHANNEL; only a
+# TRUNCATE is reported by table name and drops every target.
+TABLE_NAMESPACE_PREFIXES: dict[str, tuple[str, ...]] = {
+    "custom_meta_value": (META_VALUES_PREFIX,),
+}
+
+# Session.info key holding namespaces to drop once the transaction commits
+_PENDING_INVALIDATIONS = "cache_invalidations"
+
+
+class ResponseCache:
+    """LRU cache with a per-entry TTL, grouped into namespaces for invalidation"""
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, Hashable], tuple[float, Any]] = OrderedDict()
+        # Keys held in each namespace, so invalidation doesn't scan every entry
+        self._namespaces: dict[str, set[Hashable]] = {}
+
+    def get(self, namespace: str, key: Hashable) -> Any | None:
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            self._discard((namespace, key))
+            return None
+        self._entries.move_to_end((namespace, key))
+        return value
+
+    def set(self, namespace: str, key: Hashable, value: Any) -> None:
+        self._entries[(namespace, key)] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end((namespace, key))
+        self._namespaces.setdefault(namespace, set()).add(key)
+        while len(self._entries) > self.maxsize:
+            self._discard(next(iter(self._entries)))
+
+    def invalidate(self, *namespaces: str) -> None:
+        """Drop every entry in the given namespaces"""
+        for namespace in namespaces:
+            for key in self._namespaces.pop(namespace, ()):
+                del self._entries[(namespace, key)]
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Drop every entry in the namespaces starting with prefix"""
+        self.invalidate(*[namespace for namespace in self._namespaces if namespace.startswith(prefix)])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._namespaces.clear()
+
+    def _discard(self, entry_key: tuple[str, Hashable]) -> None:
+        del self._entries[entry_key]
+        namespace, key = entry_key
+        keys = self._namespaces[namespace]
+        keys.discard(key)
+        if not keys:
+            del self._namespaces[namespace]
+
+
+_settings = get_settings()
+response_cache = ResponseCache(ttl=_settings.response_cache_ttl, maxsize=_settings.response_cache_maxsize)
+
+
+# Namespaces of caches other than response_cache to drop when a notifying
+# table changes, registered by the modules owning those caches
+_NOTIFIED_CACHES: dict[str, list[tuple[ResponseCache, str]]] = {}
+
+
+def invalidate_on_notify(table_name: str, cache: ResponseCache, namespace: str) -> None:
+    """Drop namespace from cache whenever a NOTIFY reports a write to table_name"""
+    _NOTIFIED_CACHES.setdefault(table_name, []).append((cache, namespace))
+
+
+def meta_values_namespace(target_type: str, target_id: str) -> str:
+    """Cache namespace holding one target's meta value responses"""
+    return f"{META_VALUES_PREFIX}{target_type}:{target_id}"
+
+
+def invalidate_on_commit(
+    session: AsyncSession, *namespaces: str, cache: ResponseCache = response_cache
+) -> None:
+    """Drop the namespaces from cache when the session's transaction commits"""
+    session.info.setdefault(_PENDING_INVALIDATIONS, set()).update((cache, namespace) for namespace in namespaces)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_invalidations(session: Session) -> None:
+    for cache, namespace in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        cache.invalidate(namespace)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS, None)
+
+
+def cached(namespace: str | Callable[..., str]) -> Callable[[F], F]:
+    """
+    Cache the body of an endpoint's JSON Response in response_cache
+
+    The key is built from the endpoint's keyword arguments, leaving out the
+    session. A callable namespace is called with the same keyword arguments.
+    Errors are not cached. Writers must register
+    invalidate_on_commit(session, namespace).
+
+    Usage:
+        @router.get("/", responses={200: {"model": list[CodeSetOut]}})
+        @cached("codesets")
+        async def list_codesets(session: AsyncSession = Depends(get_session)):
+            ...
+    """
+    def decorator(func: F) -> F:
+        @wraps(func)
+        async def wrapper(**kwargs):
+            entry_namespace = namespace(**kwargs) if callable(namespace) else namespace
+            key = tuple(sorted((k, v) for k, v in kwargs.items() if not isinstance(v, AsyncSession)))
+            body = response_cache.get(entry_namespace, key)
+            if body is not None:
+                return json_response(body)
+            response = await func(**kwargs)
+            response_cache.set(entry_namespace, key, response.body)
+            return response
+
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def _on_notify(_connection, _pid, _channel, table_name: str) -> None:
+    response_cache.invalidate(*TABLE_NAMESPACES.get(table_name, ()))
+    for prefix in TABLE_NAMESPACE_PREFIXES.get(table_name, ()):
+        response_cache.invalidate_prefix(prefix)
+    for cache, namespace in _NOTIFIED_CACHES.get(table_name, ()):
+        cache.invalidate(namespace)
+
+
+def _on_value_notify(_connection, _pid, _channel, target: str) -> None:
+    target_type, _, target_id = target.partition(":")
+    response_cache.invalidate(meta_values_namespace(target_type, target_id))
+
+
+def _clear_notified_caches() -> None:
+    """Drop everything the NOTIFY handlers could have invalidated"""
+    response_cache.clear()
+    for registered in _NOTIFIED_CACHES.values():
+        for cache, namespace in registered:
+            cache.invalidate(namespace)
+
+
+class InvalidationListener:
+    """
+    Dedicated connection LISTENing on NOTIFY_CHANNEL and NOTIFY_VALUES_CHANNEL
+
+    Notifications sent while the connection is down are lost, so when it
+    drops the listener reconnects with exponential backoff and clears the
+    caches once it is back. Until then caching falls back to TTL expiry.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        initial_delay: float = 1.0,
+        max_delay: float = 60.0,
+    ):
+        self._connect = connect
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+        self._connection = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._closed = False
+
+    async def start(self) -> None:
+        """Connect, or keep retrying in the background if that fails"""
+        try:
+            await self._listen()
+        except Exception:
+            logger.warning(
+                "Cache invalidation listener could not connect; cached responses "
+                "only expire by TTL until it does",
+                exc_info=True,
+            )
+            self._schedule_reconnect()
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            try:
+                await self._reconnect_task
+            except asyncio.CancelledError:
+                pass
+        if self._connection is not None and not self._connection.is_closed():
+            await self._connection.close()
+
+    async def _listen(self) -> None:
+        connection = await self._connect()
+        await connection.add_listener(NOTIFY_CHANNEL, _on_notify)
+        await connection.add_listener(NOTIFY_VALUES_CHANNEL, _on_value_notify)
+        connection.add_termination_listener(self._on_termination)
+        self._connection = connection
+
+    def _on_termination(self, _connection) -> None:
+        if self._closed:
+            return
+        logger.warning("Cache invalidation listener lost its connection; reconnecting")
+        self._schedule_reconnect()
+
+    def _schedule_reconnect(self) -> None:
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = self._initial_delay
+        while not self._closed:
+            await asyncio.sleep(delay)
+            try:
+                await self._listen()
+            except Exception:
+                delay = min(delay * 2, self._max_delay)
+                logger.warning("Cache invalidation listener reconnect failed; retrying in %.0fs", delay, exc_info=True)
+                continue
+            _clear_notified_caches()
+            logger.info("Cache invalidation listener reconnected; caches cleared")
+            return
+
+
+async def listen_for_invalidations(database_url: str) -> InvalidationListener:
+    """
+    Invalidate response_cache whenever another process writes a catalog table
+
+    Starts an InvalidationListener on a dedicated asyncpg connection and
+    returns it; the caller closes it on shutdown. A failed connect is logged,
+    not raised. PostgreSQL only.
+    """
+    import asyncpg
+
+    dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+    listener = InvalidationListener(lambda: asyncpg.connect(dsn))
+    await listener.start()
+    return listener
@@ -1,5 +1,7 @@
+import os
 from functools import lru_cache
 
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
@@ -7,6 +9,24 @@ class Settings(BaseSettings):
     app_name: str = "MetaHub Async API"
     database_url: str = "sqlite+aiosqlite:///./test.db"
     debug: bool = True
+    query_cache_size: int = 1200
+
+    # In-process cache for catalog list endpoints
+    response_cache_ttl: float = 60.0
+    response_cache_maxsize: int = 512
+
+    # Connection pool (PostgreSQL/asyncpg only)
+    db_pool_size: int = Field(default_factory=lambda: (os.cpu_count() or 1) * 2)
+    db_max_overflow: int = 0
+    db_pool_pre_ping: bool = True
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 3600
+    db_statement_cache_size: int = 500
+    # Behind PgBouncer in transaction mode: no app-side pool, no prepared statements
+    db_pgbouncer: bool = False
+    # Direct PostgreSQL URL for the cache invalidation LISTEN connection, which
+    # can't go through PgBouncer's transaction pooling; defaults to database_url
+    cache_listen_url: str | None = None
 
     class Config:
         env_file = ".env"
@@ -53,13 +53,19 @@ def transactional(
     def decorator(func: F) -> F:
         if not asyncio.iscoroutinefunction(func):
             raise TypeError("@transactional can only be applied to async functions")
+        name = func.__name__
+        # Propagation rules that don't depend on the caller's session
+        always_new = propagation == "requires_new" or (read_only and propagation == "required")
+        nested = propagation == "nested"
+        rollback_reused = read_only and propagation == "requires_new"
 
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            existing = get_current_session()
-            use_new = (propagation == "requires_new" or
-                      existing is None or
-                      (read_only and propagation == "required" and existing is not None))
+            existing = _current_session.get()
+            use_new = always_new or existing is None
+            if not use_new and not nested:
+                # Joining the caller's transaction, which owns commit and rollback
+                return await func(*args, **kwargs)
 
             session: AsyncSession
             token = None
@@ -69,18 +75,18 @@ def transactional(
                 session = AsyncSessionLocal()
                 token = _current_session.set(session)
                 created_here = True
-                logger.debug(f"Created new session for {func.__name__}")
+                logger.debug("Created new session for %s", name)
             else:
                 session = existing  # type: ignore[assignment]
-                logger.debug(f"Reusing existing session for {func.__name__}")
+                logger.debug("Reusing existing session for %s", name)
 
             try:
                 # Handle nested transactions with savepoints
-                if propagation == "nested" and not use_new:
+                if nested and not use_new:
                     async with session.begin_nested():
-                        logger.debug(f"Starting nested transaction for {func.__name__}")
+                        logger.debug("Starting nested transaction for %s", name)
                         result = await func(*args, **kwargs)
-                        logger.debug(f"Nested transaction completed for {func.__name__}")
+                        logger.debug("Nested transaction completed for %s", name)
                     return result
 
                 # Execute business logic
@@ -89,30 +95,30 @@ def transactional(
                 # Handle commit/rollback for session created here
                 if created_here:
                     if read_only:
-                        logger.debug(f"Rolling back read-only transaction for {func.__name__}")
+                        logger.debug("Rolling back read-only transaction for %s", name)
                         await session.rollback()
                     else:
-                        logger.debug(f"Committing transaction for {func.__name__}")
+                        logger.debug("Committing transaction for %s", name)
                         await session.commit()
-                elif read_only and propagation == "requires_new":
-                    logger.debug(f"Rolling back requires_new read-only transaction for {func.__name__}")
+                elif rollback_reused:
+                    logger.debug("Rolling back requires_new read-only transaction for %s", name)
                     await session.rollback()
 
                 return result
 
-            except Exception as e:
-                logger.error(f"Transaction failed in {func.__name__}: {e}")
+            except Exception:
+                logger.exception("Transaction failed in %s", name)
                 try:
                     if session.in_transaction():
                         await session.rollback()
-                        logger.debug(f"Rolled back transaction for {func.__name__}")
+                        logger.debug("Rolled back transaction for %s", name)
                 except Exception as rollback_error:
-                    logger.error(f"Rollback failed in {func.__name__}: {rollback_error}")
+                    logger.error("Rollback failed in %s: %s", name, rollback_error)
                 raise
             finally:
                 if created_here:
                     await session.close()
-                    logger.debug(f"Closed session for {func.__name__}")
+                    logger.debug("Closed session for %s", name)
                     if token is not None:
                         _current_session.reset(token)
 
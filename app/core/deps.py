@@ -1,24 +1,67 @@
 from collections.abc import AsyncIterator
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import _current_session
-from app.db.session import AsyncSessionLocal
+from app.db.session import AsyncSessionLocal, ReadSessionLocal
 
-__all__ = ["get_session", "get_repository_session"]
+__all__ = ["get_session", "get_stream_session", "get_repository_session"]
 
+# Bound once; these run on every request and every repository call
+_get_session = _current_session.get
+_set_session = _current_session.set
+_reset_session = _current_session.reset
 
-async def get_session() -> AsyncIterator[AsyncSession]:
+
+# Methods whose endpoints only read
+_READ_METHODS = frozenset({"GET", "HEAD"})
+
+
+async def get_session(request: Request) -> AsyncIterator[AsyncSession]:
     """
     FastAPI dependency for request-scoped session
     Used by services with @transactional decorator
+
+    The whole request runs in one transaction, committed when the endpoint
+    returns and rolled back if it raises. GET and HEAD requests only read and
+    run in autocommit mode instead, without a transaction around them.
+    """
+    if request.method in _READ_METHODS:
+        session = ReadSessionLocal()
+        token = _set_session(session)
+        try:
+            yield session
+        finally:
+            _reset_session(token)
+            await session.close()
+        return
+
+    session = AsyncSessionLocal()
+    token = _set_session(session)
+    try:
+        async with session.begin():
+            yield session
+    finally:
+        _reset_session(token)
+        await session.close()
+
+
+async def get_stream_session() -> AsyncIterator[AsyncSession]:
+    """
+    FastAPI dependency for endpoints returning stream_ndjson responses
+
+    Server-side cursors only exist inside a transaction, which the autocommit
+    sessions of GET requests never begin (asyncpg refuses to open the cursor).
+    This session is not begun here either: the first statement begins its
+    transaction, and the stream closes the session after the last row.
     """
     session = AsyncSessionLocal()
-    token = _current_session.set(session)
+    token = _set_session(session)
     try:
         yield session
     finally:
-        _current_session.reset(token)
+        _reset_session(token)
         await session.close()
 
 
@@ -27,7 +70,7 @@ async def get_repository_session() -> AsyncSession:
     Get current session from context (for repositories)
     This should only be used within @transactional decorated functions
     """
-    session = _current_session.get()
+    session = _get_session()
     if session is None:
         raise RuntimeError("No active session found. Make sure to call this within @transactional decorated function.")
     return session
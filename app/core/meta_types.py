@@ -77,22 +77,25 @@ SYSTEM_META_ITEMS: dict[str, MetaItemDefinition] = {
     ),
 }
 
+# Type kind of each system meta item, for lookups that fall back to the database
+META_ITEM_TYPE_KINDS: dict[str, MetaTypeKind] = {
+    code: item_def.type_kind for code, item_def in SYSTEM_META_ITEMS.items()
+}
+
+_META_TYPE_KIND_VALUES = frozenset(kind.value for kind in MetaTypeKind)
+
 
 def validate_meta_type_kind(type_kind: str) -> bool:
     """Validate if a meta type kind is supported"""
-    try:
-        MetaTypeKind(type_kind)
-        return True
-    except ValueError:
-        return False
+    return type_kind in _META_TYPE_KIND_VALUES
 
 
 def get_meta_item_type_kind(item_code: str) -> MetaTypeKind:
     """Get the type kind for a meta item by its code"""
-    item_def = SYSTEM_META_ITEMS.get(item_code)
-    if not item_def:
-        raise ValueError(f"Unknown meta item code: {item_code}")
-    return item_def.type_kind
+    try:
+        return META_ITEM_TYPE_KINDS[item_code]
+    except KeyError:
+        raise ValueError(f"Unknown meta item code: {item_code}") from None
 
 
 def get_all_meta_type_kinds() -> list[MetaTypeKind]:
@@ -0,0 +1,44 @@
+"""
+Pre-serialized JSON responses for endpoints that bypass response_model
+"""
+import hashlib
+from collections.abc import Callable, Iterable
+
+import orjson
+from fastapi import Request, Response
+from sqlalchemy import Row
+
+# Renders UTC datetimes with a "Z" suffix, as pydantic does
+JSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+def rows_json(rows: Iterable[Row]) -> bytes:
+    """Serialize column rows as a JSON array of objects"""
+    return orjson.dumps([row._asdict() for row in rows], option=JSON_OPTIONS)
+
+
+def json_response(body: bytes) -> Response:
+    return Response(body, media_type="application/json")
+
+
+def make_etag(parts: Iterable[str | None]) -> str:
+    """Strong ETag over the identifiers that determine a response body"""
+    digest = hashlib.blake2b("|".join(part or "" for part in parts).encode(), digest_size=8)
+    return f'"{digest.hexdigest()}"'
+
+
+def conditional_json_response(request: Request, etag: str, build_body: Callable[[], bytes]) -> Response:
+    """
+    Answer 304 Not Modified if the client already holds etag
+
+    build_body is only called when the body has to be sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers={"ETag": etag})
+
+    response = json_response(build_body())
+    response.headers["ETag"] = etag
+    return response
@@ -0,0 +1,74 @@
+"""
+Streaming responses for large result sets
+"""
+from collections.abc import AsyncIterator, Callable, Mapping
+from typing import Any
+
+import orjson
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.responses import JSON_OPTIONS
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def _ndjson_lines(
+    session: AsyncSession, stmt: Select, params: Mapping[str, Any] | None, chunk_size: int
+) -> AsyncIterator[bytes]:
+    try:
+        result = await session.stream(stmt.execution_options(yield_per=chunk_size), params)
+        async for partition in result.mappings().partitions():
+            yield b"".join(orjson.dumps(dict(row), option=JSON_OPTIONS) + b"\n" for row in partition)
+    finally:
+        await session.close()
+
+
+async def _ndjson_objects(
+    session: AsyncSession,
+    stmt: Select,
+    build: Callable[[Any], Mapping[str, Any]],
+    params: Mapping[str, Any] | None,
+    chunk_size: int,
+) -> AsyncIterator[bytes]:
+    try:
+        result = await session.stream_scalars(stmt.execution_options(yield_per=chunk_size), params)
+        async for partition in result.partitions():
+            yield b"".join(orjson.dumps(build(obj), option=JSON_OPTIONS) + b"\n" for obj in partition)
+    finally:
+        await session.close()
+
+
+def stream_ndjson(
+    session: AsyncSession,
+    stmt: Select,
+    params: Mapping[str, Any] | None = None,
+    chunk_size: int = 200,
+) -> StreamingResponse:
+    """
+    Stream the rows of a column SELECT as newline-delimited JSON
+
+    Rows are fetched chunk_size at a time, so memory stays bounded however
+    large the result. The request's dependency cleanup has already run by the
+    time the body is sent, so the session is reused and closed once the last
+    row is written. The cursor needs a transaction, so the session must come
+    from get_stream_session rather than the autocommit GET session.
+    """
+    return StreamingResponse(_ndjson_lines(session, stmt, params, chunk_size), media_type=NDJSON_MEDIA_TYPE)
+
+
+def stream_ndjson_objects(
+    session: AsyncSession,
+    stmt: Select,
+    build: Callable[[Any], Mapping[str, Any]],
+    params: Mapping[str, Any] | None = None,
+    chunk_size: int = 200,
+) -> StreamingResponse:
+    """
+    Stream the entities of an ORM SELECT as newline-delimited JSON
+
+    Like stream_ndjson, but each entity is turned into a JSON object by
+    build(). Relationships build() reads must be eager-loaded by stmt.
+    """
+    return StreamingResponse(_ndjson_objects(session, stmt, build, params, chunk_size), media_type=NDJSON_MEDIA_TYPE)
@@ -1,6 +1,10 @@
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime
+from functools import partial
 
+from sqlalchemy import String
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase
 
 
@@ -8,9 +12,23 @@ class Base(DeclarativeBase):
     pass
 
 
+# UUID key columns: native 16-byte uuid on PostgreSQL, text elsewhere.
+# Values are str in Python either way.
+UuidStr = String(36).with_variant(UUID(as_uuid=False), "postgresql")
+
+
 def new_uuid() -> str:
     return str(uuid.uuid4())
 
 
-def utcnow() -> datetime:
-    return datetime.now(UTC)
+def is_uuid(value: str) -> bool:
+    """Whether value can be compared with a UuidStr column on every backend"""
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
+# Column default for every timestamp; a partial calls datetime.now directly
+utcnow: Callable[[], datetime] = partial(datetime.now, UTC)
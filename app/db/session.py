@@ -1,9 +1,63 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from typing import Any
+from uuid import uuid4
 
-from app.core.config import get_settings
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import Settings, get_settings
 
 settings = get_settings()
 
-engine = create_async_engine(settings.database_url, pool_pre_ping=True)
-AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+def _engine_url(settings: Settings) -> URL:
+    """The configured URL, with asyncpg as the driver for a bare postgresql:// URL"""
+    url = make_url(settings.database_url)
+    if url.drivername == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg")
+    return url
+
+
+def _engine_options(settings: Settings) -> dict[str, Any]:
+    """Engine keyword arguments for the configured backend"""
+    options: dict[str, Any] = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "query_cache_size": settings.query_cache_size,
+    }
+    if make_url(settings.database_url).get_backend_name() != "postgresql":
+        return options
+
+    if settings.db_pgbouncer:
+        # PgBouncer already pools, and its server connections change between
+        # transactions, so prepared statements can't be cached either. The
+        # statements SQLAlchemy still prepares get unique names, so one left on
+        # a server connection by another client never clashes with ours.
+        options.update(
+            poolclass=NullPool,
+            connect_args={
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            },
+        )
+    else:
+        # Sized connection pool, handing out the most recently used connection
+        # first so idle ones stay warm, and asyncpg's prepared statement cache
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_use_lifo=True,
+            connect_args={"prepared_statement_cache_size": settings.db_statement_cache_size},
+        )
+    return options
+
+
+engine = create_async_engine(_engine_url(settings), **_engine_options(settings))
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+# Sessions for read-only requests: every statement commits on its own, so no
+# BEGIN/COMMIT round trips wrap the reads
+ReadSessionLocal = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"), expire_on_commit=False, autoflush=False
+)
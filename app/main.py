@@ -1,16 +1,47 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.engine import make_url
 
 import app.models  # Import to register all models
 from app.api.v1 import api_router
+from app.core.cache import listen_for_invalidations
 from app.core.config import get_settings
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Cross-process cache invalidation needs LISTEN/NOTIFY (PostgreSQL)
+    listener = None
+    if make_url(settings.database_url).get_backend_name() == "postgresql":
+        if settings.cache_listen_url:
+            listener = await listen_for_invalidations(settings.cache_listen_url)
+        elif settings.db_pgbouncer:
+            # LISTEN doesn't survive PgBouncer's transaction pooling
+            logger.warning(
+                "db_pgbouncer is set without cache_listen_url: writes from other processes "
+                "won't invalidate cached responses, which only expire by TTL"
+            )
+        else:
+            listener = await listen_for_invalidations(settings.database_url)
+    try:
+        yield
+    finally:
+        if listener is not None:
+            await listener.close()
 
 app = FastAPI(
     title=settings.app_name,
     debug=settings.debug,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Include API routes
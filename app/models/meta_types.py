@@ -5,7 +5,7 @@ from datetime import datetime
 from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base, new_uuid, utcnow
+from app.db.base import Base, UuidStr, new_uuid, utcnow
 
 # CustomMetaType is now managed in code via app/core/meta_types.py
 # Database table is no longer needed - all type information comes from code
@@ -14,7 +14,7 @@ from app.db.base import Base, new_uuid, utcnow
 class CustomMetaGroup(Base):
     __tablename__ = "custom_meta_group"
 
-    group_id: Mapped[str] = mapped_column(String(36), primary_key=True, default=new_uuid)
+    group_id: Mapped[str] = mapped_column(UuidStr, primary_key=True, default=new_uuid)
     group_code: Mapped[str] = mapped_column(String(100), unique=True)
     display_name: Mapped[str] = mapped_column(String(200))
     sort_order: Mapped[int] = mapped_column(Integer, default=0)
@@ -24,7 +24,7 @@ class CustomMetaGroup(Base):
 class CustomMetaItem(Base):
     __tablename__ = "custom_meta_item"
 
-    item_id: Mapped[str] = mapped_column(String(36), primary_key=True, default=new_uuid)
+    item_id: Mapped[str] = mapped_column(UuidStr, primary_key=True, default=new_uuid)
     item_code: Mapped[str] = mapped_column(String(150), unique=True)
     display_name: Mapped[str] = mapped_column(String(200))
 
@@ -36,7 +36,8 @@ class CustomMetaItem(Base):
     selection_mode: Mapped[str] = mapped_column(String(10), default="SINGLE")  # SINGLE|MULTI (TAXONOMY only)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
 
-    group: Mapped[CustomMetaGroup] = relationship()
+    # Must be loaded explicitly (e.g. selectinload) so listings can't fall into N+1
+    group: Mapped[CustomMetaGroup] = relationship(lazy="raise")
 
 
 # CustomMetaTypeCodeSet and CustomMetaTypeTaxonomy are no longer needed
@@ -5,7 +5,6 @@ from datetime import datetime
 from sqlalchemy import (
     DateTime,
     ForeignKey,
-    Index,
     Integer,
     String,
     Text,
@@ -13,36 +12,46 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base, new_uuid, utcnow
+from app.db.base import Base, UuidStr, new_uuid, utcnow
 
 
 class CustomMetaValue(Base):
     __tablename__ = "custom_meta_value"
 
-    value_id: Mapped[str] = mapped_column(String(36), primary_key=True, default=new_uuid)
+    value_id: Mapped[str] = mapped_column(UuidStr, primary_key=True, default=new_uuid)
     target_type: Mapped[str] = mapped_column(String(50))  # 'table','column','job', etc.
     target_id: Mapped[str] = mapped_column(String(200))
     item_id: Mapped[str] = mapped_column(ForeignKey("custom_meta_item.item_id"))
-    current_version_id: Mapped[str | None] = mapped_column(String(36))
+    current_version_id: Mapped[str | None] = mapped_column(UuidStr)
+    # Version number the next CustomMetaValueVersion of this value gets
+    next_version_no: Mapped[int] = mapped_column(Integer, default=1, server_default="1")
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
 
     __table_args__ = (
-        UniqueConstraint("target_type", "target_id", "item_id", name="uq_value_target_item"),
-        Index("ix_value_target", "target_type", "target_id"),
+        # Also serves list-by-target as a prefix scan; on PostgreSQL it carries
+        # current_version_id so (target, item) lookups can skip the heap
+        UniqueConstraint(
+            "target_type",
+            "target_id",
+            "item_id",
+            name="uq_value_target_item",
+            postgresql_include=["current_version_id"],
+        ),
     )
 
     item: Mapped[CustomMetaItem] = relationship()
     current_version: Mapped[CustomMetaValueVersion | None] = relationship(
-        primaryjoin="CustomMetaValue.current_version_id==CustomMetaValueVersion.version_id",
-        foreign_keys="CustomMetaValue.current_version_id",
+        primaryjoin=lambda: CustomMetaValue.current_version_id == CustomMetaValueVersion.version_id,
+        foreign_keys=[current_version_id],
         viewonly=True,
+        lazy="raise",
     )
 
 
 class CustomMetaValueVersion(Base):
     __tablename__ = "custom_meta_value_version"
 
-    version_id: Mapped[str] = mapped_column(String(36), primary_key=True, default=new_uuid)
+    version_id: Mapped[str] = mapped_column(UuidStr, primary_key=True, default=new_uuid)
     value_id: Mapped[str] = mapped_column(ForeignKey("custom_meta_value.value_id"), index=True)
     version_no: Mapped[int] = mapped_column(Integer)
 
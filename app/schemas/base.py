@@ -1,7 +1,12 @@
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+
+class ORMModel(BaseModel):
+    """Response schema that can be validated straight from ORM instances"""
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MetaValuePrimitive(BaseModel):
@@ -41,7 +46,7 @@ class TermContentUpdate(BaseModel):
     reason: str | None = None
 
 
-class TermOut(BaseModel):
+class TermOut(ORMModel):
     term_id: str
     term_key: str
     display_name: str
@@ -56,7 +61,7 @@ class TermContentIn(BaseModel):
 
 
 # CodeSet schemas
-class CodeSetOut(BaseModel):
+class CodeSetOut(ORMModel):
     codeset_id: str
     codeset_code: str
     name: str
@@ -68,7 +73,7 @@ class CodeSetCreate(BaseModel):
     name: str
     description: str | None = None
 
-class CodeOut(BaseModel):
+class CodeOut(ORMModel):
     code_id: str
     code_key: str
     codeset_id: str
@@ -95,7 +100,7 @@ class MetaTypeCreate(BaseModel):
     type_kind: str = "PRIMITIVE"
     schema_json: str | None = None
 
-class MetaGroupOut(BaseModel):
+class MetaGroupOut(ORMModel):
     group_id: str
     group_code: str
     display_name: str
@@ -107,7 +112,7 @@ class MetaGroupCreate(BaseModel):
     display_name: str
     sort_order: int = 0
 
-class MetaItemOut(BaseModel):
+class MetaItemOut(ORMModel):
     item_id: str
     item_code: str
     display_name: str
@@ -143,7 +148,7 @@ class MetaValueOut(BaseModel):
 class MetaValueVersionOut(BaseModel):
     version_id: str
     version_no: int
-    value_json: str | None = None
+    value_json: Any | None = None  # for PRIMITIVE type (any JSON value)
     value_string: str | None = None  # for STRING type
     code_id: str | None = None
     code_key: str | None = None
@@ -170,7 +175,7 @@ class MetaValueWithVersionOut(BaseModel):
     current_version: MetaValueVersionOut | None = None
 
 # Taxonomy schemas
-class TaxonomyOut(BaseModel):
+class TaxonomyOut(ORMModel):
     taxonomy_id: str
     taxonomy_code: str
     name: str
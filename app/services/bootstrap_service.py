@@ -1,3 +1,4 @@
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.meta_types import (
@@ -5,6 +6,7 @@ from app.core.meta_types import (
     SYSTEM_META_ITEMS,
     get_meta_item_type_kind,
 )
+from app.db.base import new_uuid
 from app.models.codeset import Code, CodeSet, CodeVersion
 from app.models.meta_types import (
     CustomMetaGroup,
@@ -15,59 +17,57 @@ from app.models.taxonomy import Taxonomy, Term
 
 async def bootstrap_demo(session: AsyncSession):
     """Create a sample taxonomy, codeset, meta types/items for quick manual tests."""
-    # Let the caller handle the transaction
-    tax = Taxonomy(taxonomy_code="DATA_DOMAIN", name="Data Domain")
-    session.add(tax)
-    await session.flush()
+    # Let the caller handle the transaction. Seed rows don't need the identity
+    # map, so each table gets one bulk INSERT; keys are assigned here so rows
+    # can reference their parents.
+    taxonomy_id = new_uuid()
+    await session.execute(
+        insert(Taxonomy), [{"taxonomy_id": taxonomy_id, "taxonomy_code": "DATA_DOMAIN", "name": "Data Domain"}]
+    )
 
     # Terms (flat for demo)
-    t_fin = Term(taxonomy_id=tax.taxonomy_id, term_key="FIN", display_name="Finance")
-    t_hr = Term(taxonomy_id=tax.taxonomy_id, term_key="HR", display_name="Human Resources")
-    session.add_all([t_fin, t_hr])
+    await session.execute(insert(Term), [
+        {"taxonomy_id": taxonomy_id, "term_key": "FIN", "display_name": "Finance"},
+        {"taxonomy_id": taxonomy_id, "term_key": "HR", "display_name": "Human Resources"},
+    ])
 
-    cs = CodeSet(codeset_code="PII_LEVEL", name="PII Level")
-    session.add(cs)
-    await session.flush()
+    codeset_id = new_uuid()
+    await session.execute(insert(CodeSet), [{"codeset_id": codeset_id, "codeset_code": "PII_LEVEL", "name": "PII Level"}])
 
-    c_public = Code(codeset_id=cs.codeset_id, code_key="PUBLIC")
-    c_restricted = Code(codeset_id=cs.codeset_id, code_key="RESTRICTED")
-    session.add_all([c_public, c_restricted])
-    await session.flush()
-
-    # seed code versions and move pointers
-    for code, label in [(c_public, "Public"), (c_restricted, "Restricted")]:
-        vno = 1
-        ver = CodeVersion(code_id=code.code_id, version_no=vno, label_default=label)
-        session.add(ver)
-        await session.flush()
-        code.current_version_id = ver.code_version_id
+    # seed codes with their first version as current
+    codes = []
+    code_versions = []
+    for code_key, label in [("PUBLIC", "Public"), ("RESTRICTED", "Restricted")]:
+        code_id, version_id = new_uuid(), new_uuid()
+        codes.append({"code_id": code_id, "codeset_id": codeset_id, "code_key": code_key, "current_version_id": version_id})
+        code_versions.append({"code_version_id": version_id, "code_id": code_id, "version_no": 1, "label_default": label})
+    await session.execute(insert(Code), codes)
+    await session.execute(insert(CodeVersion), code_versions)
 
     # Meta types are now managed in code - no database records needed!
 
     # Create meta groups from code definitions
-    meta_groups = {}
-    for group_def in SYSTEM_META_GROUPS.values():
-        grp = CustomMetaGroup(
-            group_code=group_def.code,
-            display_name=group_def.display_name,
-            sort_order=group_def.sort_order
-        )
-        session.add(grp)
-        meta_groups[group_def.code] = grp
-    await session.flush()
-
-    # Create meta items from code definitions
-    for item_def in SYSTEM_META_ITEMS.values():
-        # Get type_kind from code instead of database
-        type_kind = get_meta_item_type_kind(item_def.code)
+    group_ids = {group_def.code: new_uuid() for group_def in SYSTEM_META_GROUPS.values()}
+    await session.execute(insert(CustomMetaGroup), [
+        {
+            "group_id": group_ids[group_def.code],
+            "group_code": group_def.code,
+            "display_name": group_def.display_name,
+            "sort_order": group_def.sort_order,
+        }
+        for group_def in SYSTEM_META_GROUPS.values()
+    ])
 
-        item = CustomMetaItem(
-            item_code=item_def.code,
-            display_name=item_def.display_name,
-            group_id=meta_groups[item_def.group_code].group_id,
-            type_kind=type_kind.value,  # Store directly in item
-            is_required=item_def.is_required,
-            selection_mode=item_def.selection_mode,
-            default_json=item_def.default_json
-        )
-        session.add(item)
+    # Create meta items from code definitions; type_kind is stored directly
+    await session.execute(insert(CustomMetaItem), [
+        {
+            "item_code": item_def.code,
+            "display_name": item_def.display_name,
+            "group_id": group_ids[item_def.group_code],
+            "type_kind": get_meta_item_type_kind(item_def.code).value,
+            "is_required": item_def.is_required,
+            "selection_mode": item_def.selection_mode,
+            "default_json": item_def.default_json,
+        }
+        for item_def in SYSTEM_META_ITEMS.values()
+    ])
@@ -1,22 +1,35 @@
 
 import json
-from typing import Any
+from collections import Counter
+from typing import Any, NamedTuple
 
+import orjson
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, joinedload, raiseload
 
+from app.core.cache import (
+    ResponseCache,
+    invalidate_on_commit,
+    invalidate_on_notify,
+    meta_values_namespace,
+)
 from app.core.database import transactional
 from app.core.deps import get_repository_session
-from app.core.meta_types import MetaTypeKind, get_meta_item_type_kind
-from app.db.base import utcnow
-from app.models.codeset import Code
+from app.core.meta_types import (
+    META_ITEM_TYPE_KINDS,
+    MetaTypeKind,
+    get_meta_item_type_kind,
+)
+from app.db.base import is_uuid, new_uuid, utcnow
+from app.models.codeset import Code, CodeSet, CodeVersion
 from app.models.meta_types import CustomMetaItem
 from app.models.meta_values import (
     CustomMetaValue,
     CustomMetaValueVersion,
 )
-from app.models.taxonomy import Term
+from app.models.taxonomy import Taxonomy, Term
 from app.schemas.base import (
     MetaValueCode,
     MetaValuePrimitive,
@@ -24,18 +37,109 @@ from app.schemas.base import (
     MetaValueTaxMulti,
     MetaValueTaxSingle,
 )
-from app.services.utils import _next_version_no
+
+# Shared statements; per-call values are passed as bind parameters
+_ITEM_BY_CODE = select(
+    CustomMetaItem.item_id, CustomMetaItem.type_kind, CustomMetaItem.selection_mode
+).where(CustomMetaItem.item_code == bindparam("item_code"))
+# Value with its item and current version, looked up by item code in one query
+_VALUE_BY_TARGET_ITEM_CODE = (
+    select(CustomMetaValue)
+    .join(CustomMetaValue.item)
+    .options(contains_eager(CustomMetaValue.item), joinedload(CustomMetaValue.current_version), raiseload("*"))
+    .where(
+        CustomMetaValue.target_type == bindparam("target_type"),
+        CustomMetaValue.target_id == bindparam("target_id"),
+        CustomMetaItem.item_code == bindparam("item_code"),
+    )
+)
+_VALUE_ROW_FOR_UPDATE = select(CustomMetaValue).where(
+    CustomMetaValue.target_type == bindparam("target_type"),
+    CustomMetaValue.target_id == bindparam("target_id"),
+    CustomMetaValue.item_id == bindparam("item_id"),
+).with_for_update()
+# Close a version unless something already did; the value row lock taken by
+# _ensure_value_row serialises writers, so the version needs no lock of its own
+_CLOSE_VERSION = (
+    update(CustomMetaValueVersion)
+    .where(
+        CustomMetaValueVersion.version_id == bindparam("prev_version_id"),
+        CustomMetaValueVersion.valid_to.is_(None),
+    )
+    .values(valid_to=bindparam("closed_at"))
+)
+_CODE_BY_KEY = select(Code).where(Code.code_key == bindparam("code_key"))
+_CODE_WITH_VERSION_BY_KEY = (
+    select(Code)
+    .join(CodeVersion, Code.current_version_id == CodeVersion.code_version_id)
+    .join(CodeSet, Code.codeset_id == CodeSet.codeset_id)
+    .where(Code.code_key == bindparam("code_key"))
+)
+_TERM_KEYS_IN = select(Term.term_key).where(Term.term_key.in_(bindparam("term_keys", expanding=True)))
+_TERMS_IN = (
+    select(Term.term_id, Term.term_key, Term.display_name, Taxonomy.taxonomy_code)
+    .join(Taxonomy, Term.taxonomy_id == Taxonomy.taxonomy_id)
+    .where(Term.term_key.in_(bindparam("term_keys", expanding=True)))
+)
+
+# Parsed value_json by version_id; a version's value never changes once written
+_parsed_values = ResponseCache(ttl=3600, maxsize=10_000)
+
+
+def parse_value_json(version: CustomMetaValueVersion) -> Any:
+    """Parse a version's value_json, reusing earlier parses of the same version
+
+    The result is shared between callers and must not be mutated.
+    """
+    parsed = _parsed_values.get("value_json", version.version_id)
+    if parsed is None:
+        parsed = orjson.loads(version.value_json)
+        _parsed_values.set("value_json", version.version_id, parsed)
+    return parsed
+
+
+class _ItemInfo(NamedTuple):
+    """The columns of a meta item that value writes need"""
+    item_id: str
+    type_kind: str
+    selection_mode: str | None
+
+
+# Meta items by item_code, kept out of response_cache so its entries stay
+# response bodies. Entries are immutable snapshots rather than ORM instances,
+# so caching one never detaches an object the caller's session still tracks.
+_meta_items = ResponseCache(ttl=60, maxsize=1024)
+invalidate_on_notify("custom_meta_item", _meta_items, "meta_items")
 
 
-async def _ensure_value_row(session: AsyncSession, target_type: str, target_id: str, item: CustomMetaItem) -> CustomMetaValue:
+def invalidate_meta_items_on_commit(session: AsyncSession) -> None:
+    """Drop the cached meta items once the session's transaction commits"""
+    invalidate_on_commit(session, "meta_items", cache=_meta_items)
+
+
+async def _get_item_by_code(session: AsyncSession, item_code: str) -> _ItemInfo | None:
+    """
+    Load a meta item by code, keeping found items in _meta_items
+
+    Items are never modified through the API, so the snapshot stays valid
+    until the meta_items namespace is invalidated. Misses are not cached.
+    """
+    item = _meta_items.get("meta_items", item_code)
+    if item is None:
+        row = (await session.execute(_ITEM_BY_CODE, {"item_code": item_code})).one_or_none()
+        if row is None:
+            return None
+        item = _ItemInfo(*row)
+        _meta_items.set("meta_items", item_code, item)
+    return item
+
+
+async def _ensure_value_row(
+    session: AsyncSession, target_type: str, target_id: str, item: CustomMetaItem | _ItemInfo
+) -> CustomMetaValue:
     res = await session.execute(
-        select(CustomMetaValue)
-        .where(
-            CustomMetaValue.target_type == target_type,
-            CustomMetaValue.target_id == target_id,
-            CustomMetaValue.item_id == item.item_id,
-        )
-        .with_for_update()
+        _VALUE_ROW_FOR_UPDATE,
+        {"target_type": target_type, "target_id": target_id, "item_id": item.item_id},
     )
     mv = res.scalar_one_or_none()
     if not mv:
@@ -45,6 +149,18 @@ async def _ensure_value_row(session: AsyncSession, target_type: str, target_id:
     return mv
 
 
+def _take_version_no(mv: CustomMetaValue) -> int:
+    """
+    Claim the next version number of a value row
+
+    The row is locked by _ensure_value_row, and the bump is flushed in the
+    same UPDATE that moves current_version_id.
+    """
+    version_no = mv.next_version_no
+    mv.next_version_no = version_no + 1
+    return version_no
+
+
 @transactional()
 async def set_meta_value_primitive(
     *,
@@ -77,7 +193,7 @@ async def set_meta_value_primitive(
             if prev and prev.valid_to is None:
                 prev.valid_to = utcnow()
 
-        version_no = await _next_version_no(session, CustomMetaValueVersion, "value_id", mv.value_id)
+        version_no = _take_version_no(mv)
         # Store in unified JSON format
         unified_value = {
             "type": "PRIMITIVE",
@@ -86,7 +202,7 @@ async def set_meta_value_primitive(
         v = CustomMetaValueVersion(
             value_id=mv.value_id,
             version_no=version_no,
-            value_json_v2=json.dumps(unified_value),
+            value_json=json.dumps(unified_value),
             author=payload.author,
             reason=payload.reason,
         )
@@ -128,7 +244,7 @@ async def set_meta_value_string(
             if prev and prev.valid_to is None:
                 prev.valid_to = utcnow()
 
-        version_no = await _next_version_no(session, CustomMetaValueVersion, "value_id", mv.value_id)
+        version_no = _take_version_no(mv)
         # Store in unified JSON format
         unified_value = {
             "type": "STRING",
@@ -137,7 +253,7 @@ async def set_meta_value_string(
         v = CustomMetaValueVersion(
             value_id=mv.value_id,
             version_no=version_no,
-            value_json_v2=json.dumps(unified_value),
+            value_json=json.dumps(unified_value),
             author=payload.author,
             reason=payload.reason,
         )
@@ -173,16 +289,18 @@ async def set_meta_value_codeset(
 
         # For CODESET type, directly find code by key within the appropriate codeset
         # Assume the codeset_code matches the item_code for simplicity
-        code = (
-            (await session.execute(select(Code).where(Code.code_id == payload.code_key_or_id))).scalar_one_or_none()
-            or (
+        # Only a UUID can be a code_id; anything else is looked up by key alone
+        code = None
+        if is_uuid(payload.code_key_or_id):
+            code = (await session.execute(select(Code).where(Code.code_id == payload.code_key_or_id))).scalar_one_or_none()
+        if code is None:
+            code = (
                 await session.execute(
                     select(Code).join(Code.codeset).where(
                         Code.code_key == payload.code_key_or_id
                     )
                 )
             ).scalar_one_or_none()
-        )
         if not code:
             raise HTTPException(400, "invalid code for codeset")
 
@@ -192,7 +310,7 @@ async def set_meta_value_codeset(
             if prev and prev.valid_to is None:
                 prev.valid_to = utcnow()
 
-        version_no = await _next_version_no(session, CustomMetaValueVersion, "value_id", mv.value_id)
+        version_no = _take_version_no(mv)
         # Store in unified JSON format
         unified_value = {
             "type": "CODESET",
@@ -202,7 +320,7 @@ async def set_meta_value_codeset(
         v = CustomMetaValueVersion(
             value_id=mv.value_id,
             version_no=version_no,
-            value_json_v2=json.dumps(unified_value),
+            value_json=json.dumps(unified_value),
         )
         session.add(v)
         await session.flush()
@@ -238,17 +356,17 @@ async def set_meta_value_taxonomy_single(
 
         # For TAXONOMY type, directly find term by key
         # Assume the taxonomy_code matches the item_code for simplicity
-        from app.models.taxonomy import Taxonomy
-        term = (
-            (await session.execute(select(Term).where(Term.term_id == payload.term_key_or_id))).scalar_one_or_none()
-            or (
+        term = None
+        if is_uuid(payload.term_key_or_id):
+            term = (await session.execute(select(Term).where(Term.term_id == payload.term_key_or_id))).scalar_one_or_none()
+        if term is None:
+            term = (
                 await session.execute(
                     select(Term).join(Taxonomy, Term.taxonomy_id == Taxonomy.taxonomy_id).where(
                         Term.term_key == payload.term_key_or_id
                     )
                 )
             ).scalar_one_or_none()
-        )
         if not term:
             raise HTTPException(400, "invalid term for taxonomy")
 
@@ -258,7 +376,7 @@ async def set_meta_value_taxonomy_single(
             if prev and prev.valid_to is None:
                 prev.valid_to = utcnow()
 
-        version_no = await _next_version_no(session, CustomMetaValueVersion, "value_id", mv.value_id)
+        version_no = _take_version_no(mv)
         # Store in unified JSON format
         unified_value = {
             "type": "TAXONOMY",
@@ -268,7 +386,7 @@ async def set_meta_value_taxonomy_single(
         v = CustomMetaValueVersion(
             value_id=mv.value_id,
             version_no=version_no,
-            value_json_v2=json.dumps(unified_value),
+            value_json=json.dumps(unified_value),
         )
         session.add(v)
         await session.flush()
@@ -304,19 +422,19 @@ async def set_meta_value_taxonomy_multi(
 
         # For TAXONOMY type, directly find terms by key
         # Assume the taxonomy_code matches the item_code for simplicity
-        from app.models.taxonomy import Taxonomy
         terms: list[Term] = []
         for key in payload.term_keys_or_ids:
-            term = (
-                (await session.execute(select(Term).where(Term.term_id == key))).scalar_one_or_none()
-                or (
+            term = None
+            if is_uuid(key):
+                term = (await session.execute(select(Term).where(Term.term_id == key))).scalar_one_or_none()
+            if term is None:
+                term = (
                     await session.execute(
                         select(Term).join(Taxonomy, Term.taxonomy_id == Taxonomy.taxonomy_id).where(
                             Term.term_key == key
                         )
                     )
                 ).scalar_one_or_none()
-            )
             if not term:
                 raise HTTPException(400, f"invalid term: {key}")
             terms.append(term)
@@ -329,7 +447,7 @@ async def set_meta_value_taxonomy_multi(
             if prev and prev.valid_to is None:
                 prev.valid_to = utcnow()
 
-        version_no = await _next_version_no(session, CustomMetaValueVersion, "value_id", mv.value_id)
+        version_no = _take_version_no(mv)
         # Store in unified JSON format
         unified_value = {
             "type": "TAXONOMY",
@@ -339,7 +457,7 @@ async def set_meta_value_taxonomy_multi(
         v = CustomMetaValueVersion(
             value_id=mv.value_id,
             version_no=version_no,
-            value_json_v2=json.dumps(unified_value)
+            value_json=json.dumps(unified_value)
         )
         session.add(v)
         await session.flush()
@@ -383,7 +501,7 @@ async def set_meta_value_unified(
         raise HTTPException(404, f"meta item not found: {item_code}")
 
     # Get database item for constraints
-    item = (await session.execute(select(CustomMetaItem).where(CustomMetaItem.item_code == item_code))).scalar_one_or_none()
+    item = await _get_item_by_code(session, item_code)
     if not item:
         raise HTTPException(500, f"meta item {item_code} not found in database - sync issue")
 
@@ -405,78 +523,121 @@ async def set_meta_value_unified(
 
     # Close previous version
     if mv.current_version_id:
-        prev = await session.get(CustomMetaValueVersion, mv.current_version_id, with_for_update=True)
-        if prev and prev.valid_to is None:
-            prev.valid_to = utcnow()
+        await session.execute(_CLOSE_VERSION, {"prev_version_id": mv.current_version_id, "closed_at": utcnow()})
 
-    # Create new version with unified JSON
-    version_no = await _next_version_no(session, CustomMetaValueVersion, "value_id", mv.value_id)
+    # Create new version with unified JSON. Its key is assigned up front so one
+    # flush both inserts it and points the value row at it; sessions don't
+    # autoflush, and later reads in this transaction must see it.
     v = CustomMetaValueVersion(
+        version_id=new_uuid(),
         value_id=mv.value_id,
-        version_no=version_no,
-        value_json=json.dumps(enriched_json),
+        version_no=_take_version_no(mv),
+        value_json=orjson.dumps(enriched_json).decode(),
         author=author,
         reason=reason,
     )
     session.add(v)
-    await session.flush()
     mv.current_version_id = v.version_id
+    await session.flush()
+    invalidate_on_commit(session, meta_values_namespace(target_type, target_id))
     return v.version_id
 
 
+async def _validate_value(session: AsyncSession, value_data: dict[str, Any]) -> None:
+    value_type = value_data["type"]
+    if "value" not in value_data:
+        raise HTTPException(400, f"{value_type} type requires 'value' field")
+    if value_type == "STRING" and not isinstance(value_data["value"], str):
+        raise HTTPException(400, "STRING type 'value' must be a string")
+    # Stored with orjson, which rejects integers wider than 64 bits
+    try:
+        orjson.dumps(value_data["value"])
+    except orjson.JSONEncodeError as e:
+        raise HTTPException(400, f"{value_type} 'value' can't be stored as JSON: {e}")
+
+
+async def _validate_code(session: AsyncSession, value_data: dict[str, Any]) -> None:
+    if "code_key" not in value_data:
+        raise HTTPException(400, "CODESET type requires 'code_key' field")
+    # Validate code exists
+    result = await session.execute(_CODE_BY_KEY, {"code_key": value_data["code_key"]})
+    code = result.scalar_one_or_none()
+    if not code:
+        raise HTTPException(400, f"Invalid code_key: {value_data['code_key']}")
+
+
+async def _validate_terms(session: AsyncSession, value_data: dict[str, Any]) -> None:
+    if "term_keys" not in value_data:
+        raise HTTPException(400, "TAXONOMY type requires 'term_keys' field")
+    if not isinstance(value_data["term_keys"], list):
+        raise HTTPException(400, "TAXONOMY 'term_keys' must be a list")
+
+    # Validate selection mode
+    selection_mode = value_data.get("selection_mode", "SINGLE")
+    if selection_mode == "SINGLE" and len(value_data["term_keys"]) != 1:
+        raise HTTPException(400, "SINGLE selection mode requires exactly one term_key")
+    elif selection_mode == "MULTI" and len(value_data["term_keys"]) == 0:
+        raise HTTPException(400, "MULTI selection mode requires at least one term_key")
+
+    # Validate terms exist, all keys in one IN query
+    result = await session.execute(_TERM_KEYS_IN, {"term_keys": value_data["term_keys"]})
+    found = Counter(result.scalars())
+    for term_key in value_data["term_keys"]:
+        if not found[term_key]:
+            raise HTTPException(400, f"Invalid term_key: {term_key}")
+        if found[term_key] > 1:
+            raise HTTPException(400, f"Ambiguous term_key: {term_key}")
+
+
+async def _enrich_code(session: AsyncSession, value_data: dict[str, Any]) -> dict[str, Any]:
+    result = await session.execute(_CODE_WITH_VERSION_BY_KEY, {"code_key": value_data["code_key"]})
+    code = result.scalar_one()
+
+    # Get current version and codeset separately to avoid lazy loading issues
+    current_version = await session.get_one(CodeVersion, code.current_version_id)
+    codeset = await session.get_one(CodeSet, code.codeset_id)
+
+    return {
+        "code_id": code.code_id,
+        "code_key": code.code_key,
+        "code_label": current_version.label_default,
+        "codeset_code": codeset.codeset_code,
+    }
+
+
+async def _enrich_terms(session: AsyncSession, value_data: dict[str, Any]) -> dict[str, Any]:
+    result = await session.execute(_TERMS_IN, {"term_keys": value_data["term_keys"]})
+    terms_by_key = {row.term_key: row._asdict() for row in result}
+
+    return {
+        # Keep the caller's term_keys order
+        "terms": [terms_by_key[term_key] for term_key in value_data["term_keys"]],
+        "selection_mode": value_data.get("selection_mode", "SINGLE"),
+    }
+
+
+# Per-type steps of set_meta_value_unified, keyed by value_data["type"]
+_VALIDATORS = {
+    "PRIMITIVE": _validate_value,
+    "STRING": _validate_value,
+    "CODESET": _validate_code,
+    "TAXONOMY": _validate_terms,
+}
+_ENRICHERS = {
+    "CODESET": _enrich_code,
+    "TAXONOMY": _enrich_terms,
+}
+
+
 async def _validate_unified_value_data(
     session: AsyncSession,
-    item: CustomMetaItem,
+    item: _ItemInfo,
     value_data: dict[str, Any]
 ) -> None:
     """Validate unified value data structure."""
-
-    value_type = value_data["type"]
-
-    if value_type == "PRIMITIVE":
-        if "value" not in value_data:
-            raise HTTPException(400, "PRIMITIVE type requires 'value' field")
-
-    elif value_type == "STRING":
-        if "value" not in value_data:
-            raise HTTPException(400, "STRING type requires 'value' field")
-        if not isinstance(value_data["value"], str):
-            raise HTTPException(400, "STRING type 'value' must be a string")
-
-    elif value_type == "CODESET":
-        if "code_key" not in value_data:
-            raise HTTPException(400, "CODESET type requires 'code_key' field")
-        # Validate code exists
-        from app.models.codeset import Code
-        result = await session.execute(
-            select(Code).where(Code.code_key == value_data["code_key"])
-        )
-        code = result.scalar_one_or_none()
-        if not code:
-            raise HTTPException(400, f"Invalid code_key: {value_data['code_key']}")
-
-    elif value_type == "TAXONOMY":
-        if "term_keys" not in value_data:
-            raise HTTPException(400, "TAXONOMY type requires 'term_keys' field")
-        if not isinstance(value_data["term_keys"], list):
-            raise HTTPException(400, "TAXONOMY 'term_keys' must be a list")
-
-        # Validate selection mode
-        selection_mode = value_data.get("selection_mode", "SINGLE")
-        if selection_mode == "SINGLE" and len(value_data["term_keys"]) != 1:
-            raise HTTPException(400, "SINGLE selection mode requires exactly one term_key")
-        elif selection_mode == "MULTI" and len(value_data["term_keys"]) == 0:
-            raise HTTPException(400, "MULTI selection mode requires at least one term_key")
-
-        # Validate terms exist
-        from app.models.taxonomy import Term
-        for term_key in value_data["term_keys"]:
-            result = await session.execute(
-                select(Term).where(Term.term_key == term_key)
-            )
-            term = result.scalar_one_or_none()
-            if not term:
-                raise HTTPException(400, f"Invalid term_key: {term_key}")
+    validator = _VALIDATORS.get(value_data["type"])
+    if validator is not None:
+        await validator(session, value_data)
 
 
 async def _enrich_value_data(
@@ -484,69 +645,10 @@ async def _enrich_value_data(
     value_data: dict[str, Any]
 ) -> dict[str, Any]:
     """Enrich value data with full reference information."""
-
     enriched = value_data.copy()
-    value_type = value_data["type"]
-
-    if value_type == "CODESET":
-        # Enrich with full code information
-        from app.models.codeset import Code, CodeSet, CodeVersion
-        result = await session.execute(
-            select(Code)
-            .join(CodeVersion, Code.current_version_id == CodeVersion.code_version_id)
-            .join(CodeSet, Code.codeset_id == CodeSet.codeset_id)
-            .where(Code.code_key == value_data["code_key"])
-        )
-        code = result.scalar_one()
-
-        # Get current version and codeset separately to avoid lazy loading issues
-        from app.models.codeset import CodeSet, CodeVersion
-        cv_result = await session.execute(
-            select(CodeVersion).where(CodeVersion.code_version_id == code.current_version_id)
-        )
-        current_version = cv_result.scalar_one()
-
-        cs_result = await session.execute(
-            select(CodeSet).where(CodeSet.codeset_id == code.codeset_id)
-        )
-        codeset = cs_result.scalar_one()
-
-        enriched.update({
-            "code_id": code.code_id,
-            "code_key": code.code_key,
-            "code_label": current_version.label_default,
-            "codeset_code": codeset.codeset_code,
-        })
-
-    elif value_type == "TAXONOMY":
-        # Enrich with full term information
-        from app.models.taxonomy import Taxonomy, Term
-        terms = []
-        for term_key in value_data["term_keys"]:
-            result = await session.execute(
-                select(Term)
-                .join(Taxonomy, Term.taxonomy_id == Taxonomy.taxonomy_id)
-                .where(Term.term_key == term_key)
-            )
-            term = result.scalar_one()
-
-            # Get taxonomy separately to avoid lazy loading
-            from app.models.taxonomy import Taxonomy
-            tax_result = await session.execute(
-                select(Taxonomy).where(Taxonomy.taxonomy_id == term.taxonomy_id)
-            )
-            taxonomy = tax_result.scalar_one()
-
-            terms.append({
-                "term_id": term.term_id,
-                "term_key": term.term_key,
-                "display_name": term.display_name,
-                "taxonomy_code": taxonomy.taxonomy_code,
-            })
-
-        enriched["terms"] = terms
-        enriched["selection_mode"] = value_data.get("selection_mode", "SINGLE")
-
+    enricher = _ENRICHERS.get(value_data["type"])
+    if enricher is not None:
+        enriched.update(await enricher(session, value_data))
     return enriched
 
 
@@ -559,38 +661,33 @@ async def get_meta_value_unified(
 ) -> dict[str, Any] | None:
     """Get a meta value in unified JSON format."""
 
-    # Get meta item
-    item = (await session.execute(
-        select(CustomMetaItem).where(CustomMetaItem.item_code == item_code)
-    )).scalar_one_or_none()
-    if not item:
-        return None
-
-    # Get meta value
+    # Get meta value; an unknown item code finds no row either
     mv = (await session.execute(
-        select(CustomMetaValue).where(
-            CustomMetaValue.target_type == target_type,
-            CustomMetaValue.target_id == target_id,
-            CustomMetaValue.item_id == item.item_id
-        )
+        _VALUE_BY_TARGET_ITEM_CODE,
+        {"target_type": target_type, "target_id": target_id, "item_code": item_code},
     )).scalar_one_or_none()
 
     if not mv or not mv.current_version_id:
         return None
 
-    # Get current version
-    version = (await session.execute(
-        select(CustomMetaValueVersion).where(
-            CustomMetaValueVersion.version_id == mv.current_version_id
-        )
-    )).scalar_one_or_none()
+    # Current version is join-loaded with the value
+    version = mv.current_version
 
     if not version:
         return None
 
+    return await version_value_data(session, version, mv.item)
+
+
+async def version_value_data(
+    session: AsyncSession,
+    version: CustomMetaValueVersion,
+    item: CustomMetaItem,
+) -> dict[str, Any] | None:
+    """Unified JSON of an already loaded version."""
     # Return unified JSON if available, otherwise migrate on-demand
     if version.value_json:
-        return json.loads(version.value_json)
+        return parse_value_json(version)
     else:
         # Fallback: migrate legacy data on-the-fly (read-only)
         return await _migrate_legacy_data_on_demand(session, version, item)
@@ -603,10 +700,7 @@ async def _migrate_legacy_data_on_demand(
 ) -> dict[str, Any] | None:
     """Migrate legacy data format to unified format on-demand (read-only)."""
 
-    try:
-        item_type_kind = get_meta_item_type_kind(item.item_code)
-    except ValueError:
-        item_type_kind = MetaTypeKind(item.type_kind)
+    item_type_kind = META_ITEM_TYPE_KINDS.get(item.item_code) or MetaTypeKind(item.type_kind)
 
     if item_type_kind == MetaTypeKind.PRIMITIVE and version.value_json_v2:
         data = json.loads(version.value_json_v2)
@@ -1,13 +1,61 @@
 import json
 
-from sqlalchemy import select
+from sqlalchemy import Integer, bindparam, func, insert, literal_column, select, update
 
 from app.core.database import transactional
 from app.core.deps import get_repository_session
-from app.db.base import utcnow
+from app.db.base import new_uuid, utcnow
 from app.models.taxonomy import Term, TermVersion
 from app.schemas.base import TermContentUpdate
-from app.services.utils import _next_version_no
+
+# Close a version unless something already did; the term row lock serialises writers
+_CLOSE_TERM_VERSION = (
+    update(TermVersion)
+    .where(TermVersion.version_id == bindparam("prev_version_id"), TermVersion.valid_to.is_(None))
+    .values(valid_to=bindparam("closed_at"))
+)
+# Insert the next version, numbering it from the term's existing versions in
+# the same statement. A Core insert: the ORM would take the parameters for a
+# bulk INSERT of rows.
+_INSERT_NEXT_TERM_VERSION = insert(TermVersion.__table__).from_select(
+    [
+        TermVersion.version_id,
+        TermVersion.term_id,
+        TermVersion.version_no,
+        TermVersion.body_markdown,
+        TermVersion.body_json,
+        TermVersion.author,
+        TermVersion.change_reason,
+        TermVersion.valid_from,
+    ],
+    select(
+        bindparam("new_version_id", type_=TermVersion.version_id.type),
+        bindparam("for_term_id", type_=TermVersion.term_id.type),
+        func.coalesce(func.max(TermVersion.version_no), 0) + 1,
+        bindparam("new_body_markdown", type_=TermVersion.body_markdown.type),
+        bindparam("new_body_json", type_=TermVersion.body_json.type),
+        bindparam("new_author", type_=TermVersion.author.type),
+        bindparam("new_change_reason", type_=TermVersion.change_reason.type),
+        bindparam("new_valid_from", type_=TermVersion.valid_from.type),
+    ).where(TermVersion.term_id == bindparam("for_term_id")),
+)
+
+# A term and its descendants with their depth below it, walked in SQL
+_subtree = (
+    select(Term.term_id, literal_column("0", Integer).label("depth"))
+    .where(Term.term_id == bindparam("root_term_id"))
+    .cte("term_subtree", recursive=True)
+)
+_subtree = _subtree.union_all(
+    select(Term.term_id, _subtree.c.depth + 1)
+    .join(_subtree, Term.parent_term_id == _subtree.c.term_id)
+    .where(_subtree.c.depth < bindparam("max_depth"))
+)
+_TERM_SUBTREE = (
+    select(Term)
+    .join(_subtree, Term.term_id == _subtree.c.term_id)
+    .order_by(_subtree.c.depth, Term.term_key)
+)
 
 
 @transactional()
@@ -27,24 +75,31 @@ async def upsert_term_content(
 
     # Close previous current version (if any)
     if term.current_version_id:
-        prev = await session.get(TermVersion, term.current_version_id, with_for_update=True)
-        if prev and prev.valid_to is None:
-            prev.valid_to = utcnow()
+        await session.execute(_CLOSE_TERM_VERSION, {"prev_version_id": term.current_version_id, "closed_at": utcnow()})
 
     # Create new version
-    version_no = await _next_version_no(session, TermVersion, "term_id", term_id)
-    v = TermVersion(
-        term_id=term_id,
-        version_no=version_no,
-        body_markdown=payload.body_markdown,
-        body_json=None if payload.body_json is None else json.dumps(payload.body_json),
-        author=payload.author,
-        change_reason=payload.reason,
-    )
-    session.add(v)
-    await session.flush()
+    version_id = new_uuid()
+    await session.execute(_INSERT_NEXT_TERM_VERSION, {
+        "new_version_id": version_id,
+        "for_term_id": term_id,
+        "new_body_markdown": payload.body_markdown,
+        "new_body_json": None if payload.body_json is None else json.dumps(payload.body_json),
+        "new_author": payload.author,
+        "new_change_reason": payload.reason,
+        "new_valid_from": utcnow(),
+    })
 
     # Move pointer
-    term.current_version_id = v.version_id
+    term.current_version_id = version_id
+
+    return version_id
+
 
-    return v.version_id
+@transactional()
+async def get_term_subtree(root_term_id: str, max_depth: int = 20) -> list[Term]:
+    """Load a term and its descendants up to max_depth levels below it in one query.
+    Terms are ordered by depth, then key; an unknown root gives an empty list.
+    """
+    session = await get_repository_session()
+    result = await session.execute(_TERM_SUBTREE, {"root_term_id": root_term_id, "max_depth": max_depth})
+    return list(result.scalars())
@@ -1,9 +1,49 @@
-from sqlalchemy import func, select
+from typing import Any
+
+from sqlalchemy import Select, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING
+_CONFLICT_INSERTS = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+def _select_for(model, schema) -> Select:
+    """SELECT of the model columns backing each field of a response schema.
+    Row keys are the schema's field names, so rows_json() serializes the rows
+    directly into the response body; no schema objects are built.
+    """
+    return select(*(getattr(model, name) for name in schema.model_fields))
+
+
+async def _insert_if_absent(session: AsyncSession, model, index_elements: list[str], **values: Any):
+    """INSERT ... ON CONFLICT DO NOTHING RETURNING in a single round trip.
+    Returns the new ORM instance, or None when a row with the same unique key already exists.
+    """
+    insert = _CONFLICT_INSERTS[session.get_bind().dialect.name]
+    stmt = (
+        insert(model)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=index_elements)
+        .returning(model)
+    )
+    return (await session.execute(stmt)).scalar_one_or_none()
+
 
-async def _next_version_no(session: AsyncSession, table, filter_col: str, filter_val) -> int:
-    """Get the next version number for a versioned entity"""
-    stmt = select(func.coalesce(func.max(table.version_no), 0)).where(getattr(table, filter_col) == filter_val)
-    res = await session.execute(stmt)
-    return int(res.scalar_one() or 0) + 1
+async def _insert_select_if_absent(session: AsyncSession, model, index_elements: list[str], source: Select):
+    """INSERT ... SELECT variant of _insert_if_absent, for rows whose values come from another table.
+    Source columns must be labeled with the target column names.
+    Returns None when the key already exists or the SELECT matched no row.
+    """
+    insert = _CONFLICT_INSERTS[session.get_bind().dialect.name]
+    stmt = (
+        insert(model)
+        .from_select([col.name for col in source.selected_columns], source)
+        .on_conflict_do_nothing(index_elements=index_elements)
+        .returning(model)
+    )
+    return (await session.execute(stmt)).scalar_one_or_none()
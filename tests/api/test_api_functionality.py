@@ -1,6 +1,11 @@
 """
 API 기능성 테스트 - 간단하고 확실한 버전
 """
+import json
+import uuid
+
+from app.api.v1 import api_router
+from app.core.deps import get_session, get_stream_session
 
 
 class TestAPIFunctionality:
@@ -103,6 +108,17 @@ class TestAPIFunctionality:
         assert response3.status_code == 404
         assert "detail" in response3.json()
 
+    def test_create_meta_item_with_malformed_group_id(self, test_client):
+        """형식이 잘못된 group_id는 조회 없이 400으로 거절"""
+        response = test_client.post("/api/v1/meta/items", json={
+            "item_code": "owner",
+            "display_name": "Owner",
+            "group_id": "not-a-uuid",
+            "type_kind": "STRING",
+        })
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Meta group 'not-a-uuid' not found"
+
     def test_basic_crud_flow(self, test_client):
         """기본적인 CRUD 플로우 테스트"""
         # Create taxonomy
@@ -130,10 +146,65 @@ class TestAPIFunctionality:
             # Should contain our created taxonomy
             codes = [tax["taxonomy_code"] for tax in taxonomies]
             assert "CRUD_TEST" in codes
+
+            # A new taxonomy has no terms yet
+            terms_response = test_client.get("/api/v1/taxonomy/CRUD_TEST/terms")
+            assert terms_response.status_code == 200
+            assert terms_response.json() == []
         else:
             # If creation failed, just verify the error is handled properly
             assert create_response.status_code in [400, 422, 500]
 
+    def test_list_reflects_create_after_cached_read(self, test_client):
+        """캐시된 목록 조회 후 생성하면 목록이 갱신되는지 확인"""
+        assert test_client.get("/api/v1/codeset/").json() == []
+
+        response = test_client.post("/api/v1/codeset/", json={"codeset_code": "CACHED", "name": "Cached"})
+        assert response.status_code == 200
+
+        codesets = test_client.get("/api/v1/codeset/").json()
+        assert [cs["codeset_code"] for cs in codesets] == ["CACHED"]
+
+        assert test_client.get("/api/v1/codeset/CACHED/codes").json() == []
+        test_client.post("/api/v1/codeset/CACHED/codes", json={"code_key": "K1"})
+        codes = test_client.get("/api/v1/codeset/CACHED/codes").json()
+        assert [code["code_key"] for code in codes] == ["K1"]
+
+    def test_stream_endpoints_match_lists(self, test_client):
+        """NDJSON 스트리밍 응답이 목록 응답과 같은 데이터를 반환하는지 확인"""
+        assert test_client.post("/api/v1/bootstrap/demo").status_code == 200
+
+        response = test_client.get("/api/v1/codeset/PII_LEVEL/codes/stream")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        streamed = [json.loads(line) for line in response.text.splitlines()]
+        assert streamed == test_client.get("/api/v1/codeset/PII_LEVEL/codes").json()
+
+        response = test_client.get("/api/v1/meta/items/stream")
+        streamed = [json.loads(line) for line in response.text.splitlines()]
+        assert streamed == test_client.get("/api/v1/meta/items").json()
+
+        assert test_client.get("/api/v1/codeset/NOTFOUND/codes/stream").status_code == 404
+
+    def test_create_meta_item_with_reserved_code(self, test_client):
+        """스트리밍/unified 경로와 겹치는 item_code는 400으로 거절"""
+        for item_code in ["stream", "unified"]:
+            response = test_client.post(
+                "/api/v1/meta/items",
+                json={"item_code": item_code, "display_name": "X", "group_id": str(uuid.uuid4()), "type_kind": "STRING"},
+            )
+            assert response.status_code == 400
+            assert response.json()["detail"] == f"Meta item code '{item_code}' is reserved"
+
+    def test_stream_endpoints_use_stream_session(self):
+        """스트리밍 엔드포인트는 autocommit GET 세션 대신 get_stream_session 사용"""
+        stream_routes = [route for route in api_router.routes if route.path.endswith("/stream")]
+        assert len(stream_routes) == 3
+        for route in stream_routes:
+            calls = {dependency.call for dependency in route.dependant.dependencies}
+            assert get_stream_session in calls
+            assert get_session not in calls
+
     def test_bootstrap_creates_expected_data(self, test_client):
         """Bootstrap이 예상된 데이터를 생성하는지 확인"""
         # Create bootstrap data
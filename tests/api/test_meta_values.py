@@ -0,0 +1,208 @@
+"""
+Meta Value API 테스트 - 타입별 저장/조회
+"""
+import json
+
+import pytest
+
+from app.core.cache import meta_values_namespace, response_cache
+
+
+@pytest.fixture
+def demo_client(test_client):
+    """데모 데이터가 생성된 클라이언트"""
+    response = test_client.post("/api/v1/bootstrap/demo")
+    assert response.status_code == 200
+    return test_client
+
+
+def put_value(client, item_code, body, target_id="orders"):
+    response = client.put(f"/api/v1/meta-values/table/{target_id}/{item_code}", json=body)
+    assert response.status_code == 200, response.json()
+    return response.json()["version_id"]
+
+
+class TestMetaValueAPI:
+    """Meta Value API 테스트 클래스"""
+
+    def test_primitive_value(self, demo_client):
+        """PRIMITIVE 값 저장 및 조회"""
+        version_id = put_value(demo_client, "retention_days", {"type": "PRIMITIVE", "value": 90})
+
+        response = demo_client.get("/api/v1/meta-values/table/orders/retention_days")
+        assert response.status_code == 200
+        version = response.json()["current_version"]
+        assert version["version_id"] == version_id
+        assert version["value_json"] == 90
+
+        unified = demo_client.get("/api/v1/meta-values/table/orders/retention_days/unified").json()
+        assert unified["value_data"] == {"type": "PRIMITIVE", "value": 90}
+
+    def test_string_value(self, demo_client):
+        """STRING 값 저장 및 조회"""
+        put_value(demo_client, "table_description", {"type": "STRING", "value": "Order facts"})
+
+        data = demo_client.get("/api/v1/meta-values/table/orders/table_description").json()
+        assert data["type_kind"] == "STRING"
+        assert data["current_version"]["value_string"] == "Order facts"
+
+    def test_codeset_value(self, demo_client):
+        """CODESET 값 저장 시 코드 정보가 함께 조회되는지 확인"""
+        put_value(demo_client, "pii_level", {"type": "CODESET", "code_key": "RESTRICTED"})
+
+        version = demo_client.get("/api/v1/meta-values/table/orders/pii_level").json()["current_version"]
+        assert version["code_key"] == "RESTRICTED"
+        assert version["code_label"] == "Restricted"
+
+        unified = demo_client.get("/api/v1/meta-values/table/orders/pii_level/unified").json()
+        assert unified["value_data"]["codeset_code"] == "PII_LEVEL"
+
+    def test_taxonomy_single_value(self, demo_client):
+        """TAXONOMY 단일 선택 값 저장 및 조회"""
+        put_value(demo_client, "domain", {"type": "TAXONOMY", "term_keys": ["FIN"]})
+
+        version = demo_client.get("/api/v1/meta-values/table/orders/domain").json()["current_version"]
+        assert version["term_key"] == "FIN"
+        assert version["term_keys"] is None
+
+    def test_taxonomy_multi_value(self, demo_client):
+        """TAXONOMY 다중 선택 값 저장 및 조회"""
+        put_value(
+            demo_client,
+            "domain",
+            {"type": "TAXONOMY", "term_keys": ["FIN", "HR"], "selection_mode": "MULTI"},
+        )
+
+        version = demo_client.get("/api/v1/meta-values/table/orders/domain").json()["current_version"]
+        assert version["term_key"] is None
+        assert version["term_keys"] == ["FIN", "HR"]
+
+        unified = demo_client.get("/api/v1/meta-values/table/orders/domain/unified").json()
+        terms = unified["value_data"]["terms"]
+        assert [term["display_name"] for term in terms] == ["Finance", "Human Resources"]
+
+    def test_new_version_replaces_current(self, demo_client):
+        """같은 항목에 다시 저장하면 새 버전이 현재 버전이 됨"""
+        put_value(demo_client, "table_description", {"type": "STRING", "value": "v1"})
+        put_value(demo_client, "table_description", {"type": "STRING", "value": "v2"})
+
+        version = demo_client.get("/api/v1/meta-values/table/orders/table_description").json()["current_version"]
+        assert version["version_no"] == 2
+        assert version["value_string"] == "v2"
+
+    def test_list_values_for_target(self, demo_client):
+        """대상의 모든 값 목록 조회"""
+        put_value(demo_client, "retention_days", {"type": "PRIMITIVE", "value": 30})
+        put_value(demo_client, "pii_level", {"type": "CODESET", "code_key": "PUBLIC"})
+        put_value(demo_client, "domain", {"type": "TAXONOMY", "term_keys": ["HR"]}, target_id="other")
+
+        values = demo_client.get("/api/v1/meta-values/table/orders").json()
+        assert sorted(value["item_code"] for value in values) == ["pii_level", "retention_days"]
+
+        unified = demo_client.get("/api/v1/meta-values/table/orders/unified").json()
+        assert sorted(value["item_code"] for value in unified) == ["pii_level", "retention_days"]
+
+    def test_reads_reflect_put_after_cached_read(self, demo_client):
+        """캐시된 조회 후 저장하면 모든 GET에서 새 값이 보여야 함"""
+        base = "/api/v1/meta-values/table/orders"
+        reads = {
+            base: lambda body: body[0]["current_version"]["value_json"],
+            f"{base}/retention_days": lambda body: body["current_version"]["value_json"],
+            f"{base}/unified": lambda body: body[0]["value_data"]["value"],
+            f"{base}/retention_days/unified": lambda body: body["value_data"]["value"],
+        }
+
+        put_value(demo_client, "retention_days", {"type": "PRIMITIVE", "value": 30})
+        for path, value_of in reads.items():
+            assert value_of(demo_client.get(path).json()) == 30
+
+        put_value(demo_client, "retention_days", {"type": "PRIMITIVE", "value": 60})
+        for path, value_of in reads.items():
+            assert value_of(demo_client.get(path).json()) == 60
+
+    def test_put_keeps_other_targets_cached(self, demo_client):
+        """저장 시 해당 target의 캐시만 무효화"""
+        put_value(demo_client, "retention_days", {"type": "PRIMITIVE", "value": 30})
+        put_value(demo_client, "retention_days", {"type": "PRIMITIVE", "value": 7}, target_id="other")
+        demo_client.get("/api/v1/meta-values/table/orders")
+        demo_client.get("/api/v1/meta-values/table/other")
+
+        put_value(demo_client, "retention_days", {"type": "PRIMITIVE", "value": 60})
+
+        orders = meta_values_namespace("table", "orders")
+        other = meta_values_namespace("table", "other")
+        assert response_cache.get(orders, ("list",)) is None
+        assert response_cache.get(other, ("list",)) is not None
+
+    def test_conditional_get_returns_304(self, demo_client):
+        """ETag이 같으면 304, 값이 바뀌면 새 ETag로 200"""
+        put_value(demo_client, "table_description", {"type": "STRING", "value": "v1"})
+
+        for path in ["/api/v1/meta-values/table/orders", "/api/v1/meta-values/table/orders/table_description"]:
+            etag = demo_client.get(path).headers["etag"]
+            response = demo_client.get(path, headers={"If-None-Match": etag})
+            assert response.status_code == 304
+            assert response.content == b""
+
+            put_value(demo_client, "table_description", {"type": "STRING", "value": path})
+            response = demo_client.get(path, headers={"If-None-Match": etag})
+            assert response.status_code == 200
+            assert response.headers["etag"] != etag
+
+    def test_stream_values_for_target(self, demo_client):
+        """NDJSON 스트리밍 응답이 목록 응답과 같은 값을 반환하는지 확인"""
+        put_value(demo_client, "retention_days", {"type": "PRIMITIVE", "value": 30})
+        put_value(demo_client, "domain", {"type": "TAXONOMY", "term_keys": ["FIN", "HR"], "selection_mode": "MULTI"})
+
+        response = demo_client.get("/api/v1/meta-values/table/orders/stream")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        streamed = [json.loads(line) for line in response.text.splitlines()]
+        assert streamed == demo_client.get("/api/v1/meta-values/table/orders").json()
+
+    def test_missing_value_returns_404(self, demo_client):
+        """저장되지 않은 값 조회 시 404"""
+        response = demo_client.get("/api/v1/meta-values/table/orders/domain")
+        assert response.status_code == 404
+
+    def test_unknown_item_returns_404(self, demo_client):
+        """존재하지 않는 항목 조회 시 404"""
+        response = demo_client.get("/api/v1/meta-values/table/orders/no_such_item")
+        assert response.status_code == 404
+        assert "Meta item" in response.json()["detail"]
+
+    def test_type_mismatch_is_rejected(self, demo_client):
+        """항목 타입과 다른 값은 400"""
+        response = demo_client.put(
+            "/api/v1/meta-values/table/orders/retention_days",
+            json={"type": "STRING", "value": "x"},
+        )
+        assert response.status_code == 400
+
+    def test_unencodable_primitive_is_rejected(self, demo_client):
+        """64비트를 넘는 정수는 저장하지 않고 400"""
+        response = demo_client.put(
+            "/api/v1/meta-values/table/orders/retention_days",
+            json={"type": "PRIMITIVE", "value": 2**70},
+        )
+        assert response.status_code == 400
+
+    def test_unknown_term_key_is_rejected(self, demo_client):
+        """존재하지 않는 term_key가 섞여 있으면 400"""
+        response = demo_client.put(
+            "/api/v1/meta-values/table/orders/domain",
+            json={"type": "TAXONOMY", "term_keys": ["FIN", "NOPE"], "selection_mode": "MULTI"},
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid term_key: NOPE"
+
+    def test_missing_payload_field_is_rejected(self, demo_client):
+        """타입별 필수 필드가 없거나 알 수 없는 타입이면 400"""
+        for body, detail in [
+            ({"type": "CODESET"}, "CODESET requires 'code_key' field"),
+            ({"type": "TAXONOMY", "term_keys": []}, "TAXONOMY requires 'term_keys' field"),
+            ({"type": "BOOLEAN", "value": True}, "Invalid type: BOOLEAN"),
+        ]:
+            response = demo_client.put("/api/v1/meta-values/table/orders/pii_level", json=body)
+            assert response.status_code == 400
+            assert response.json()["detail"] == detail
@@ -5,16 +5,17 @@ import asyncio
 import uuid
 
 import pytest
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from app.api.v1 import api_router
+from app.core.cache import response_cache
 from app.core.config import get_settings
 from app.core.database import _current_session
-from app.core.deps import get_session
+from app.core.deps import _READ_METHODS, get_session, get_stream_session
 from app.db.base import Base
+from app.services.meta_value_service import _meta_items
 
 
 @pytest.fixture(scope="function")
@@ -27,7 +28,7 @@ def test_client():
     # Test용 엔진과 세션 팩토리 생성
     engine = None
 
-    async def get_test_session():
+    async def create_session_factories():
         nonlocal engine
         engine = create_async_engine(
             test_db_url,
@@ -39,20 +40,58 @@ def test_client():
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
-        TestSessionLocal = sessionmaker(
+        # Same session options as app.db.session
+        TestSessionLocal = async_sessionmaker(
             engine,
-            class_=AsyncSession,
-            expire_on_commit=False
+            expire_on_commit=False,
+            autoflush=False,
         )
+        TestReadSessionLocal = async_sessionmaker(
+            engine.execution_options(isolation_level="AUTOCOMMIT"),
+            expire_on_commit=False,
+            autoflush=False,
+        )
+        return TestSessionLocal, TestReadSessionLocal
+
+    async def get_test_session(request: Request):
+        TestSessionLocal, TestReadSessionLocal = await create_session_factories()
+
+        # GET/HEAD는 app.core.deps와 같이 트랜잭션 없는 autocommit 세션 사용
+        if request.method in _READ_METHODS:
+            session = TestReadSessionLocal()
+            token = _current_session.set(session)
+            try:
+                yield session
+            finally:
+                _current_session.reset(token)
+                await session.close()
+            return
+
         session = TestSessionLocal()
         # Set session in context for @transactional to work
         token = _current_session.set(session)
+        try:
+            async with session.begin():
+                yield session
+        finally:
+            _current_session.reset(token)
+            await session.close()
+
+    async def get_test_stream_session():
+        # 스트리밍은 서버 측 커서용 트랜잭션이 필요하므로 autocommit이 아닌 세션 사용
+        TestSessionLocal, _ = await create_session_factories()
+        session = TestSessionLocal()
+        token = _current_session.set(session)
         try:
             yield session
         finally:
             _current_session.reset(token)
             await session.close()
 
+    # 이전 테스트 DB의 캐시된 응답 제거
+    response_cache.clear()
+    _meta_items.clear()
+
     # Create a completely new FastAPI app instance for this test
     settings = get_settings()
     app = FastAPI(
@@ -65,6 +104,7 @@ def test_client():
 
     # Override the dependency with our test session
     app.dependency_overrides[get_session] = get_test_session
+    app.dependency_overrides[get_stream_session] = get_test_stream_session
 
     # Create test client
     try:
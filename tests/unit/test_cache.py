@@ -0,0 +1,204 @@
+"""
+응답 캐시 단위 테스트
+"""
+import asyncio
+
+import pytest
+
+from app.core.cache import (
+    NOTIFY_CHANNEL,
+    NOTIFY_VALUES_CHANNEL,
+    InvalidationListener,
+    ResponseCache,
+    _on_notify,
+    _on_value_notify,
+    meta_values_namespace,
+    response_cache,
+)
+from app.services.meta_value_service import _meta_items
+
+
+class TestResponseCache:
+    """ResponseCache 테스트"""
+
+    def test_get_set(self):
+        """저장한 값을 그대로 조회"""
+        cache = ResponseCache(ttl=60, maxsize=10)
+        assert cache.get("codes", "A") is None
+
+        cache.set("codes", "A", [1, 2])
+        assert cache.get("codes", "A") == [1, 2]
+
+    def test_expired_entry_is_dropped(self):
+        """TTL이 지난 항목은 조회되지 않음"""
+        cache = ResponseCache(ttl=0, maxsize=10)
+        cache.set("codes", "A", [1])
+
+        assert cache.get("codes", "A") is None
+
+    def test_invalidate_namespace(self):
+        """네임스페이스 단위 무효화"""
+        cache = ResponseCache(ttl=60, maxsize=10)
+        cache.set("codes", "A", 1)
+        cache.set("codes", "B", 2)
+        cache.set("codesets", (), 3)
+
+        cache.invalidate("codes")
+
+        assert cache.get("codes", "A") is None
+        assert cache.get("codes", "B") is None
+        assert cache.get("codesets", ()) == 3
+
+    def test_invalidate_prefix(self):
+        """접두사가 같은 네임스페이스만 무효화"""
+        cache = ResponseCache(ttl=60, maxsize=10)
+        cache.set("mv:table:a", ("list",), 1)
+        cache.set("mv:table:b", ("list",), 2)
+        cache.set("meta_items", (), 3)
+
+        cache.invalidate_prefix("mv:")
+
+        assert cache.get("mv:table:a", ("list",)) is None
+        assert cache.get("mv:table:b", ("list",)) is None
+        assert cache.get("meta_items", ()) == 3
+
+    def test_invalidate_after_eviction(self):
+        """LRU로 제거된 항목이 있어도 무효화가 정상 동작"""
+        cache = ResponseCache(ttl=60, maxsize=1)
+        cache.set("ns", "a", 1)
+        cache.set("ns", "b", 2)
+
+        cache.invalidate("ns")
+        cache.set("ns", "c", 3)
+
+        assert cache.get("ns", "b") is None
+        assert cache.get("ns", "c") == 3
+
+    def test_lru_eviction(self):
+        """최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        cache = ResponseCache(ttl=60, maxsize=2)
+        cache.set("ns", "a", 1)
+        cache.set("ns", "b", 2)
+        cache.get("ns", "a")
+        cache.set("ns", "c", 3)
+
+        assert cache.get("ns", "a") == 1
+        assert cache.get("ns", "b") is None
+        assert cache.get("ns", "c") == 3
+
+
+class TestNotifyHandlers:
+    """NOTIFY 수신 시 무효화 범위 테스트"""
+
+    def setup_method(self):
+        response_cache.clear()
+        response_cache.set(meta_values_namespace("table", "orders"), ("list",), 1)
+        response_cache.set(meta_values_namespace("table", "db:other"), ("list",), 2)
+
+    def teardown_method(self):
+        response_cache.clear()
+
+    def test_value_notify_drops_only_its_target(self):
+        """값 변경 알림은 해당 target의 캐시만 무효화"""
+        _on_value_notify(None, 0, NOTIFY_VALUES_CHANNEL, "table:db:other")
+
+        assert response_cache.get(meta_values_namespace("table", "orders"), ("list",)) == 1
+        assert response_cache.get(meta_values_namespace("table", "db:other"), ("list",)) is None
+
+    def test_truncate_notify_drops_every_target(self):
+        """테이블 이름 알림(TRUNCATE)은 모든 target의 캐시를 무효화"""
+        _on_notify(None, 0, NOTIFY_CHANNEL, "custom_meta_value")
+
+        assert response_cache.get(meta_values_namespace("table", "orders"), ("list",)) is None
+        assert response_cache.get(meta_values_namespace("table", "db:other"), ("list",)) is None
+
+    def test_item_notify_drops_service_item_cache(self):
+        """meta item 변경 알림은 서비스의 item 캐시도 무효화"""
+        _meta_items.set("meta_items", "domain", "cached")
+
+        _on_notify(None, 0, NOTIFY_CHANNEL, "custom_meta_item")
+
+        assert _meta_items.get("meta_items", "domain") is None
+
+
+class FakeConnection:
+    """LISTEN 연결 대역: 등록된 listener를 기록하고 연결 끊김을 흉내냄"""
+
+    def __init__(self):
+        self.channels = []
+        self.termination_listeners = []
+        self.closed = False
+
+    async def add_listener(self, channel, callback):
+        self.channels.append(channel)
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+    def terminate(self):
+        self.closed = True
+        for callback in self.termination_listeners:
+            callback(self)
+
+
+class TestInvalidationListener:
+    """LISTEN 연결 재접속 테스트"""
+
+    @staticmethod
+    def make_listener(outcomes):
+        """outcomes 순서대로 연결을 반환하거나 예외를 발생시키는 listener"""
+        attempts = iter(outcomes)
+
+        async def connect():
+            outcome = next(attempts)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        return InvalidationListener(connect, initial_delay=0.001, max_delay=0.001)
+
+    @pytest.mark.asyncio
+    async def test_failed_start_does_not_raise_and_retries(self):
+        """시작 시 연결 실패는 예외 없이 백그라운드에서 재시도"""
+        connection = FakeConnection()
+        listener = self.make_listener([OSError("down"), OSError("still down"), connection])
+
+        await listener.start()
+        await asyncio.wait_for(listener._reconnect_task, 1)
+
+        assert connection.channels == [NOTIFY_CHANNEL, NOTIFY_VALUES_CHANNEL]
+        await listener.close()
+        assert connection.closed
+
+    @pytest.mark.asyncio
+    async def test_reconnect_clears_caches(self):
+        """연결이 끊기면 재접속 후 놓친 알림 대신 캐시를 비움"""
+        first, second = FakeConnection(), FakeConnection()
+        listener = self.make_listener([first, second])
+        await listener.start()
+
+        response_cache.set("codes", (), b"[]")
+        first.terminate()
+        await asyncio.wait_for(listener._reconnect_task, 1)
+
+        assert second.channels == [NOTIFY_CHANNEL, NOTIFY_VALUES_CHANNEL]
+        assert response_cache.get("codes", ()) is None
+        await listener.close()
+
+    @pytest.mark.asyncio
+    async def test_close_does_not_reconnect(self):
+        """종료 시 닫힌 연결은 재접속하지 않음"""
+        connection = FakeConnection()
+        listener = self.make_listener([connection])
+        await listener.start()
+
+        await listener.close()
+        connection.terminate()
+
+        assert listener._reconnect_task is None
@@ -3,15 +3,22 @@
 """
 import pytest
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from app.core.database import _current_session
-from app.db.base import Base
+from app.db.base import Base, new_uuid
+from app.models.meta_types import CustomMetaItem
+from app.models.meta_values import CustomMetaValueVersion
 from app.models.taxonomy import Taxonomy, Term, TermVersion
-from app.schemas.base import TermContentUpdate
+from app.schemas.base import MetaValueTaxMulti, TermContentUpdate
 from app.services.bootstrap_service import bootstrap_demo
-from app.services.term_service import upsert_term_content
+from app.services.meta_value_service import (
+    _get_item_by_code,
+    _meta_items,
+    parse_value_json,
+    set_meta_value_taxonomy_multi,
+)
+from app.services.term_service import get_term_subtree, upsert_term_content
 
 # Test database URL
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -25,7 +32,7 @@ async def create_test_session():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    TestSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    TestSessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
     return TestSessionLocal()
 
 
@@ -176,3 +183,116 @@ class TestTermService:
             assert new_version.valid_to is None  # Should be open
         finally:
             await session.close()
+
+
+    @pytest.mark.asyncio
+    async def test_get_term_subtree(self):
+        """term 하위 트리를 한 번에 조회하고 depth 제한을 지키는지 테스트"""
+        session = await create_test_session()
+
+        try:
+            await bootstrap_demo(session)
+            fin_term = (await session.execute(select(Term).where(Term.term_key == "FIN"))).scalar_one()
+            child = Term(
+                term_id=new_uuid(), taxonomy_id=fin_term.taxonomy_id, parent_term_id=fin_term.term_id,
+                term_key="FIN_AP", display_name="Accounts Payable",
+            )
+            grandchild = Term(
+                taxonomy_id=fin_term.taxonomy_id, parent_term_id=child.term_id,
+                term_key="FIN_AP_INV", display_name="Invoices",
+            )
+            session.add_all([child, grandchild])
+            await session.commit()
+
+            token = _current_session.set(session)
+            try:
+                subtree = await get_term_subtree(fin_term.term_id)
+                shallow = await get_term_subtree(fin_term.term_id, max_depth=1)
+                missing = await get_term_subtree(new_uuid())
+            finally:
+                _current_session.reset(token)
+
+            assert [term.term_key for term in subtree] == ["FIN", "FIN_AP", "FIN_AP_INV"]
+            assert [term.term_key for term in shallow] == ["FIN", "FIN_AP"]
+            assert missing == []
+        finally:
+            await session.close()
+
+class TestMetaValueService:
+    """Meta value 서비스 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_set_taxonomy_multi_with_term_keys(self):
+        """MULTI 설정은 UUID가 아닌 term key도 key로 조회해 저장"""
+        session = await create_test_session()
+
+        try:
+            await bootstrap_demo(session)
+            item = (await session.execute(
+                select(CustomMetaItem).where(CustomMetaItem.item_code == "domain")
+            )).scalar_one()
+            item.selection_mode = "MULTI"
+            await session.commit()
+
+            token = _current_session.set(session)
+            try:
+                version_id = await set_meta_value_taxonomy_multi(
+                    target_type="TABLE",
+                    target_id="sales.orders",
+                    item_code="domain",
+                    payload=MetaValueTaxMulti(term_keys_or_ids=["FIN", "HR"]),
+                )
+            finally:
+                _current_session.reset(token)
+            await session.commit()
+
+            version = (await session.execute(
+                select(CustomMetaValueVersion).where(CustomMetaValueVersion.version_id == version_id)
+            )).scalar_one()
+            assert parse_value_json(version)["term_keys"] == ["FIN", "HR"]
+        finally:
+            await session.close()
+
+
+    @pytest.mark.asyncio
+    async def test_item_lookup_keeps_session_instance(self):
+        """item 조회 캐시가 세션의 ORM 객체를 분리하지 않아 미반영 변경이 유지됨"""
+        session = await create_test_session()
+        _meta_items.clear()
+
+        try:
+            await bootstrap_demo(session)
+            await session.commit()
+
+            item = (await session.execute(
+                select(CustomMetaItem).where(CustomMetaItem.item_code == "domain")
+            )).scalar_one()
+            item.display_name = "Changed"
+
+            info = await _get_item_by_code(session, "domain")
+            assert info.item_id == item.item_id
+            assert item in session
+
+            await session.commit()
+            display_name = (await session.execute(
+                select(CustomMetaItem.display_name).where(CustomMetaItem.item_code == "domain")
+            )).scalar_one()
+            assert display_name == "Changed"
+        finally:
+            _meta_items.clear()
+            await session.close()
+
+
+class TestParseValueJson:
+    """value_json 파싱 캐시 테스트"""
+
+    def test_parse_is_reused_per_version(self):
+        """같은 버전은 한 번만 파싱하고 같은 객체를 반환"""
+        version = CustomMetaValueVersion(version_id=new_uuid(), value_json='{"type": "STRING", "value": "a"}')
+
+        parsed = parse_value_json(version)
+        assert parsed == {"type": "STRING", "value": "a"}
+        assert parse_value_json(version) is parsed
+
+        other = CustomMetaValueVersion(version_id=new_uuid(), value_json='{"type": "STRING", "value": "b"}')
+        assert parse_value_json(other)["value"] == "b"